@@ -0,0 +1,268 @@
+"""
+Двунаправленный список на параллельных массивах (арена узлов)
+Данные и связи хранятся в предвыделенных массивах, узел - это индекс ячейки
+"""
+import tracemalloc
+from array import array
+
+from main import DoublyLinkedList
+
+NIL = -1  # Отсутствующая связь
+
+
+class ArrayDoublyLinkedList:
+    """Двунаправленный список с хранением узлов в массивах"""
+
+    def __init__(self, capacity=16):
+        self._capacity = max(capacity, 1)
+        self._data = [None] * self._capacity
+        self._next = array('i', [NIL]) * self._capacity
+        self._prev = array('i', [NIL]) * self._capacity
+        self._free = array('i')  # Стек освобожденных ячеек
+        self._used = 0  # Количество когда-либо выданных ячеек
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+
+    def __str__(self):
+        """Строковое представление списка"""
+        return "[" + " <-> ".join(str(item) for item in self) + "]"
+
+    def __len__(self):
+        """Возвращает длину списка"""
+        return self.length
+
+    def is_empty(self):
+        """Проверка на пустоту списка"""
+        return self.head == NIL
+
+    def _grow(self):
+        """Увеличение емкости массивов в два раза"""
+        extra = self._capacity
+        self._data.extend([None] * extra)
+        self._next.extend(array('i', [NIL]) * extra)
+        self._prev.extend(array('i', [NIL]) * extra)
+        self._capacity += extra
+
+    def _alloc(self, data):
+        """Выделение ячейки под новый узел"""
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._used == self._capacity:
+                self._grow()
+            slot = self._used
+            self._used += 1
+
+        self._data[slot] = data
+        self._next[slot] = NIL
+        self._prev[slot] = NIL
+        return slot
+
+    def _release(self, slot):
+        """Возврат ячейки в список свободных"""
+        data = self._data[slot]
+        self._data[slot] = None
+        self._free.append(slot)
+        return data
+
+    def append(self, data):
+        """Добавление элемента в конец списка"""
+        slot = self._alloc(data)
+
+        if self.is_empty():
+            self.head = slot
+        else:
+            self._next[self.tail] = slot
+            self._prev[slot] = self.tail
+        self.tail = slot
+
+        self.length += 1
+
+    def prepend(self, data):
+        """Добавление элемента в начало списка"""
+        slot = self._alloc(data)
+
+        if self.is_empty():
+            self.tail = slot
+        else:
+            self._next[slot] = self.head
+            self._prev[self.head] = slot
+        self.head = slot
+
+        self.length += 1
+
+    def insert(self, index, data):
+        """Вставка элемента в произвольную позицию"""
+        if index < 0 or index > self.length:
+            raise IndexError("Index out of range")
+
+        if index == 0:
+            self.prepend(data)
+            return
+
+        if index == self.length:
+            self.append(data)
+            return
+
+        current = self._get_node(index)
+        slot = self._alloc(data)
+        before = self._prev[current]
+
+        self._prev[slot] = before
+        self._next[slot] = current
+        self._next[before] = slot
+        self._prev[current] = slot
+
+        self.length += 1
+
+    def _get_node(self, index):
+        """Получение номера ячейки по индексу (вспомогательный метод)"""
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of range")
+
+        if index < self.length // 2:
+            links = self._next
+            current = self.head
+            for _ in range(index):
+                current = links[current]
+        else:
+            links = self._prev
+            current = self.tail
+            for _ in range(self.length - 1 - index):
+                current = links[current]
+
+        return current
+
+    def get(self, index):
+        """Получение элемента по индексу"""
+        return self._data[self._get_node(index)]
+
+    def remove(self, index):
+        """Удаление элемента по индексу"""
+        slot = self._get_node(index)
+        before = self._prev[slot]
+        after = self._next[slot]
+
+        if before == NIL:
+            self.head = after
+        else:
+            self._next[before] = after
+
+        if after == NIL:
+            self.tail = before
+        else:
+            self._prev[after] = before
+
+        self.length -= 1
+        return self._release(slot)
+
+    def index_of(self, data):
+        """Поиск индекса элемента (первого вхождения)"""
+        for index, item in enumerate(self):
+            if item == data:
+                return index
+        return -1
+
+    def contains(self, data):
+        """Проверка наличия элемента в списке"""
+        return self.index_of(data) != -1
+
+    def clear(self):
+        """Очистка списка с освобождением массивов"""
+        self.__init__()
+
+    def reverse(self):
+        """Разворот списка за O(1): массивы связей меняются местами"""
+        self._next, self._prev = self._prev, self._next
+        self.head, self.tail = self.tail, self.head
+
+    def to_list(self):
+        """Преобразование в обычный список Python"""
+        return list(self)
+
+    def from_list(self, data_list):
+        """Создание списка из обычного списка Python за один проход"""
+        items = list(data_list)
+        count = len(items)
+        self.__init__(count)
+        if count == 0:
+            return
+
+        self._data[:] = items
+        self._next = array('i', range(1, count + 1))
+        self._next[-1] = NIL
+        self._prev = array('i', range(-1, count - 1))
+        self._used = count
+        self.head = 0
+        self.tail = count - 1
+        self.length = count
+
+    def __iter__(self):
+        """Итератор для списка"""
+        data = self._data
+        links = self._next
+        current = self.head
+        while current != NIL:
+            yield data[current]
+            current = links[current]
+
+    def iterate_backward(self):
+        """Итерация в обратном порядке"""
+        data = self._data
+        links = self._prev
+        current = self.tail
+        while current != NIL:
+            yield data[current]
+            current = links[current]
+
+
+def measure_memory(factory, count):
+    """Пиковая память и число выделений при заполнении списка"""
+    tracemalloc.start()
+    container = factory()
+    for i in range(count):
+        container.append(i)
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    allocations = sum(stat.count for stat in snapshot.statistics('filename'))
+    return peak / count, allocations
+
+
+def compare_memory(count=100_000):
+    """Сравнение расхода памяти с обычным DoublyLinkedList"""
+    print("\n" + "=" * 60)
+    print(f"РАСХОД ПАМЯТИ НА {count} ЭЛЕМЕНТОВ")
+    print("=" * 60)
+
+    for name, factory in (("DoublyLinkedList", DoublyLinkedList),
+                          ("ArrayDoublyLinkedList", ArrayDoublyLinkedList)):
+        per_element, allocations = measure_memory(factory, count)
+        print(f"{name:>22}: {per_element:7.1f} байт/элемент, "
+              f"живых выделений: {allocations}")
+
+
+def demo_array_list():
+    """Демонстрация работы списка на массивах"""
+    print("=== СПИСОК НА ПАРАЛЛЕЛЬНЫХ МАССИВАХ ===")
+
+    dll = ArrayDoublyLinkedList()
+    dll.from_list([10, 20, 30])
+    dll.prepend(5)
+    dll.insert(2, 15)
+    print(f"Список: {dll}")
+    print(f"Элемент с индексом 2: {dll.get(2)}")
+    print(f"Удаляем элемент с индексом 1: {dll.remove(1)}")
+    print(f"Список после удаления: {dll}")
+    dll.append(40)  # Ячейка удаленного узла используется повторно
+    print(f"Список после добавления 40: {dll}")
+    dll.reverse()
+    print(f"Список после разворота: {dll}")
+    print(f"Обратный порядок: {list(dll.iterate_backward())}")
+
+
+if __name__ == "__main__":
+    demo_array_list()
+    compare_memory()
@@ -0,0 +1,271 @@
+"""
+Набор измерений для DoublyLinkedList, StackUsingDLL и QueueUsingDLL
+Сравнение с list и collections.deque по времени и пиковой памяти,
+результаты сохраняются в JSON для поиска регрессий между запусками
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime, timezone
+
+from main import DoublyLinkedList, QueueUsingDLL, StackUsingDLL
+
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+OPERATIONS = ("append", "prepend", "insert_middle", "get_random", "remove",
+              "iterate", "reverse", "contains")
+# Операции, меняющие длину: для каждой серии контейнер строится заново
+RESIZING = ("append", "prepend", "insert_middle", "remove")
+DEFAULT_REPEAT = 5
+
+
+def _build_dll(size):
+    dll = DoublyLinkedList()
+    dll.from_list(range(size))
+    return dll
+
+
+def _build_stack(size):
+    stack = StackUsingDLL()
+    stack.dll.from_list(range(size))
+    return stack
+
+
+def _build_queue(size):
+    queue = QueueUsingDLL()
+    queue.dll.from_list(range(size))
+    return queue
+
+
+def _consume(iterable):
+    for _ in iterable:
+        pass
+
+
+# Контейнер -> (построение, {операция: функция(контейнер, аргументы)})
+# Аргумент операции - случайный индекс или значение, заранее одинаковый для всех
+CONTAINERS = {
+    "DoublyLinkedList": (_build_dll, {
+        "append": lambda c, x: c.append(x),
+        "prepend": lambda c, x: c.prepend(x),
+        "insert_middle": lambda c, x: c.insert(len(c) // 2, x),
+        "get_random": lambda c, i: c.get(i),
+        "remove": lambda c, i: c.remove(i),
+        "iterate": lambda c, _: _consume(c),
+        "reverse": lambda c, _: c.reverse(),
+        "contains": lambda c, x: c.contains(x),
+    }),
+    "StackUsingDLL": (_build_stack, {
+        "append": lambda c, x: c.push(x),
+        "remove": lambda c, _: c.pop(),
+        "contains": lambda c, x: c.contains(x),
+    }),
+    "QueueUsingDLL": (_build_queue, {
+        "append": lambda c, x: c.enqueue(x),
+        "remove": lambda c, _: c.dequeue(),
+        "contains": lambda c, x: c.contains(x),
+    }),
+    "list": (lambda size: list(range(size)), {
+        "append": lambda c, x: c.append(x),
+        "prepend": lambda c, x: c.insert(0, x),
+        "insert_middle": lambda c, x: c.insert(len(c) // 2, x),
+        "get_random": lambda c, i: c[i],
+        "remove": lambda c, i: c.pop(i),
+        "iterate": lambda c, _: _consume(c),
+        "reverse": lambda c, _: c.reverse(),
+        "contains": lambda c, x: x in c,
+    }),
+    "deque": (lambda size: deque(range(size)), {
+        "append": lambda c, x: c.append(x),
+        "prepend": lambda c, x: c.appendleft(x),
+        "insert_middle": lambda c, x: c.insert(len(c) // 2, x),
+        "get_random": lambda c, i: c[i],
+        "remove": lambda c, i: c.__delitem__(i),
+        "iterate": lambda c, _: _consume(c),
+        "reverse": lambda c, _: c.reverse(),
+        "contains": lambda c, x: x in c,
+    }),
+}
+
+
+def _operation_count(operation, size):
+    """Число повторов: дорогие O(n) операции на больших размерах повторяются реже"""
+    if operation in ("iterate", "reverse"):
+        return 1
+    return min(size, max(10, min(1000, 10 ** 7 // size)))
+
+
+def _arguments(operation, size, count, rng):
+    """Одинаковые для всех контейнеров аргументы операций"""
+    if operation in ("get_random", "remove"):
+        # Индексы с учетом того, что remove каждый раз укорачивает контейнер
+        return [rng.randrange(size - k) for k in range(count)]
+    if operation == "contains":
+        return [rng.randrange(size) for _ in range(count)]
+    return list(range(count))
+
+
+def _time_operation(container, action, arguments):
+    """Время выполнения серии операций"""
+    gc.collect()
+    start = time.perf_counter()
+    for argument in arguments:
+        action(container, argument)
+    return time.perf_counter() - start
+
+
+def _peak_memory(container, action, arguments):
+    """Пиковое выделение памяти во время серии операций"""
+    gc.collect()
+    tracemalloc.start()
+    for argument in arguments:
+        action(container, argument)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def _time_build(build, size):
+    """Время построения контейнера (без tracemalloc)"""
+    gc.collect()
+    start = time.perf_counter()
+    build(size)
+    return time.perf_counter() - start
+
+
+def _build_peak(build, size):
+    """Пиковое выделение памяти при построении контейнера"""
+    gc.collect()
+    tracemalloc.start()
+    container = build(size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return peak
+
+
+def run_suite(sizes=DEFAULT_SIZES, containers=None, operations=OPERATIONS, memory=True, seed=42,
+              repeat=DEFAULT_REPEAT):
+    """Прогон всех измерений, возвращает отчет в виде словаря
+
+    Весь набор проходится repeat раз, и в отчет идет лучшее время каждого
+    измерения (медиана тоже сохраняется): повторы разнесены во времени,
+    поэтому кратковременная загрузка машины не портит все попытки сразу.
+    Операции, меняющие длину, каждый раз выполняются на заново
+    построенном контейнере размера size. Память измеряется один раз
+    отдельной серией под tracemalloc, чтобы трассировка не искажала время.
+    """
+    timings = {}  # (контейнер, операция, размер) -> времена попыток
+    details = {}  # (контейнер, операция, размер) -> (число операций, делитель, пик памяти)
+
+    for attempt in range(repeat):
+        print(f"Проход {attempt + 1} из {repeat}", flush=True)
+        for size in sizes:
+            for name in containers or CONTAINERS:
+                build, actions = CONTAINERS[name]
+
+                key = (name, "build", size)
+                timings.setdefault(key, []).append(_time_build(build, size))
+                if attempt == 0:
+                    details[key] = (size, size, _build_peak(build, size) if memory else None)
+
+                shared = build(size)  # Для операций, не меняющих длину
+                for operation in operations:
+                    action = actions.get(operation)
+                    if action is None:
+                        continue
+
+                    count = _operation_count(operation, size)
+                    arguments = _arguments(operation, size, count, random.Random(seed))
+                    resizing = operation in RESIZING
+
+                    key = (name, operation, size)
+                    container = build(size) if resizing else shared
+                    timings.setdefault(key, []).append(_time_operation(container, action, arguments))
+                    if attempt == 0:
+                        peak = None
+                        if memory:
+                            container = build(size) if resizing else shared
+                            peak = _peak_memory(container, action, arguments)
+                        per_item = size if operation == "iterate" else count
+                        details[key] = (count, per_item, peak)
+
+                del shared
+
+    results = []
+    for (name, operation, size), times in timings.items():
+        count, per_item, peak = details[name, operation, size]
+        best = min(times)
+        results.append({"container": name, "operation": operation, "size": size, "ops": count,
+                        "seconds": best, "median_seconds": statistics.median(times),
+                        "repeat": len(times), "ns_per_op": best / per_item * 1e9,
+                        "peak_bytes": peak})
+        print(f"{name:>16} | {operation:>13} | n={size:<9} | "
+              f"{best / per_item * 1e9:12.1f} нс/оп | "
+              f"пик {peak if peak is not None else '-':>10} байт")
+
+    return {
+        "meta": {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "sizes": list(sizes),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare_reports(baseline, current, threshold=1.25):
+    """Список измерений, ставших медленнее порога относительно базового отчета"""
+    previous = {(r["container"], r["operation"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = previous.get((result["container"], result["operation"], result["size"]))
+        if old and old["ns_per_op"] > 0:
+            ratio = result["ns_per_op"] / old["ns_per_op"]
+            if ratio > threshold:
+                regressions.append({**result, "baseline_ns_per_op": old["ns_per_op"], "ratio": ratio})
+    return regressions
+
+
+def main(argv=None):
+    """Запуск из командной строки"""
+    parser = argparse.ArgumentParser(description="Измерения контейнеров PythonProject6")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--containers", nargs="+", choices=list(CONTAINERS))
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument("--no-memory", action="store_true", help="не измерять память (быстрее)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="число проходов набора, в отчет идет лучшее время")
+    parser.add_argument("--output", default="benchmark_report.json")
+    parser.add_argument("--compare", help="базовый JSON-отчет для поиска регрессий")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.sizes, args.containers, args.operations, memory=not args.no_memory,
+                       repeat=args.repeat)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f"\nОтчет сохранен в {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            regressions = compare_reports(json.load(file), report, args.threshold)
+        for item in regressions:
+            print(f"РЕГРЕССИЯ: {item['container']} {item['operation']} n={item['size']}: "
+                  f"{item['baseline_ns_per_op']:.1f} -> {item['ns_per_op']:.1f} нс/оп "
+                  f"({item['ratio']:.2f}x)")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
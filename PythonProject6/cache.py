@@ -0,0 +1,303 @@
+"""
+LRU и LFU кэши на основе двунаправленного списка
+Словарь дает доступ к узлу по ключу, список - порядок вытеснения за O(1)
+"""
+import functools
+import sys
+import time
+from abc import ABC, abstractmethod
+
+from main import DoublyLinkedList, Node
+
+_MISSING = object()  # Маркер отсутствующего значения
+_KWARGS_MARK = object()  # Разделитель позиционных и именованных аргументов в ключе
+
+
+class CacheEntry:
+    """Запись кэша, хранящаяся в узле списка"""
+
+    __slots__ = ('key', 'value', 'size', 'expires', 'freq')
+
+    def __init__(self, key, value, size, expires):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.freq = 1
+
+    def __str__(self):
+        return f"{self.key}: {self.value}"
+
+
+class BaseCache(ABC):
+    """Общая часть кэшей: ограничения, время жизни и счетчики"""
+
+    def __init__(self, capacity=128, max_bytes=None, ttl=None, sizeof=sys.getsizeof):
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("Byte limit must be positive")
+
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._map = {}  # Ключ -> узел списка
+        self.bytes = 0  # Оценка занятого объема данных
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, key):
+        node = self._map.get(key)
+        return node is not None and not self._expired(node.data)
+
+    def __str__(self):
+        return "{" + ", ".join(str(node.data) for node in self._map.values()) + "}"
+
+    def _expired(self, entry):
+        """Истекло ли время жизни записи"""
+        return entry.expires is not None and entry.expires <= time.monotonic()
+
+    def get(self, key, default=None):
+        """Получение значения по ключу"""
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+
+        if self._expired(node.data):
+            self._discard(node)
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._touch(node)
+        return node.data.value
+
+    def put(self, key, value):
+        """Добавление или обновление значения
+
+        Значение больше max_bytes не кэшируется: ради него пришлось бы
+        вытеснить все остальные записи, и лимит все равно был бы превышен.
+        Старое значение по этому ключу при этом удаляется.
+        """
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        node = self._map.get(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            if node is not None:
+                self._discard(node)
+            return
+
+        if node is not None:
+            entry = node.data
+            self.bytes += size - entry.size
+            entry.value = value
+            entry.size = size
+            entry.expires = expires
+            self._touch(node)
+            self._evict(0, 0)
+            return
+
+        # Место освобождается до вставки, чтобы не вытеснить новую запись
+        self._evict(1, size)
+        self._map[key] = self._insert(CacheEntry(key, value, size, expires))
+        self.bytes += size
+
+    def pop(self, key, default=None):
+        """Удаление записи с возвратом значения"""
+        node = self._map.get(key)
+        if node is None:
+            return default
+        self._discard(node)
+        return node.data.value
+
+    def clear(self):
+        """Очистка кэша (счетчики сохраняются)"""
+        for node in list(self._map.values()):
+            self._discard(node)
+
+    def stats(self):
+        """Счетчики попаданий, промахов и вытеснений"""
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._map),
+            "bytes": self.bytes,
+            "hit_rate": self.hits / requests if requests else 0.0,
+        }
+
+    def _evict(self, extra_items, extra_bytes):
+        """Вытеснение записей, пока не освободится место"""
+        while self._map and (
+                (self.capacity is not None and len(self._map) + extra_items > self.capacity) or
+                (self.max_bytes is not None and self.bytes + extra_bytes > self.max_bytes)):
+            self._discard(self._victim())
+            self.evictions += 1
+
+    def _discard(self, node):
+        """Удаление узла из словаря и из списка"""
+        del self._map[node.data.key]
+        self.bytes -= node.data.size
+        self._unlink(node)
+
+    @abstractmethod
+    def _insert(self, entry):
+        """Размещение новой записи, возвращает ее узел"""
+
+    @abstractmethod
+    def _touch(self, node):
+        """Учет обращения к записи"""
+
+    @abstractmethod
+    def _unlink(self, node):
+        """Исключение узла из структуры вытеснения"""
+
+    @abstractmethod
+    def _victim(self):
+        """Узел, который будет вытеснен следующим"""
+
+
+class LRUCache(BaseCache):
+    """Кэш с вытеснением давно не использованных записей
+
+    Начало списка - самая старая запись, конец - самая свежая.
+    """
+
+    def __init__(self, capacity=128, max_bytes=None, ttl=None, sizeof=sys.getsizeof):
+        super().__init__(capacity, max_bytes, ttl, sizeof)
+        self._order = DoublyLinkedList()
+
+    def _insert(self, entry):
+        node = Node(entry)
+        self._order._link_node(node, None)
+        return node
+
+    def _touch(self, node):
+        if node is not self._order.tail:
+            self._order._unlink(node)
+            self._order._link_node(node, None)
+
+    def _unlink(self, node):
+        self._order._unlink(node)
+
+    def _victim(self):
+        return self._order.head
+
+
+class LFUCache(BaseCache):
+    """Кэш с вытеснением редко используемых записей
+
+    Для каждой частоты обращений хранится свой список в порядке LRU,
+    поэтому при равной частоте вытесняется самая старая запись.
+    """
+
+    def __init__(self, capacity=128, max_bytes=None, ttl=None, sizeof=sys.getsizeof):
+        super().__init__(capacity, max_bytes, ttl, sizeof)
+        self._buckets = {}  # Частота -> DoublyLinkedList узлов
+        self._min_freq = 0
+
+    def _bucket(self, freq):
+        """Список записей с заданной частотой"""
+        bucket = self._buckets.get(freq)
+        if bucket is None:
+            bucket = self._buckets[freq] = DoublyLinkedList()
+        return bucket
+
+    def _insert(self, entry):
+        node = Node(entry)
+        self._bucket(1)._link_node(node, None)
+        self._min_freq = 1
+        return node
+
+    def _touch(self, node):
+        entry = node.data
+        self._unlink(node)
+        entry.freq += 1
+        self._bucket(entry.freq)._link_node(node, None)
+        if self._min_freq not in self._buckets:
+            self._min_freq = entry.freq
+
+    def _unlink(self, node):
+        freq = node.data.freq
+        bucket = self._buckets[freq]
+        bucket._unlink(node)
+        if bucket.is_empty():
+            del self._buckets[freq]
+
+    def _victim(self):
+        if self._min_freq not in self._buckets:
+            self._min_freq = min(self._buckets)
+        return self._buckets[self._min_freq].head
+
+
+def memoize(capacity=128, max_bytes=None, ttl=None, cache_class=LRUCache):
+    """Декоратор, запоминающий результаты функции в кэше
+
+    Аргументы функции должны быть хешируемыми. Кэш доступен как func.cache.
+    """
+
+    def decorator(func):
+        cache = cache_class(capacity, max_bytes, ttl)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Разделитель не может встретиться среди аргументов, поэтому
+            # f(1, a=2) и f((1,), (('a', 2),)) получают разные ключи
+            key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def demo_cache():
+    """Демонстрация работы LRU и LFU кэшей"""
+    print("=== LRU КЭШ НА 3 ЗАПИСИ ===")
+    lru = LRUCache(capacity=3)
+    for key in "ABC":
+        lru.put(key, key.lower())
+    lru.get("A")  # A становится самой свежей записью
+    lru.put("D", "d")  # Вытесняется B
+    print(f"Кэш: {lru}")
+    print(f"B в кэше: {'B' in lru}, статистика: {lru.stats()}")
+
+    print("\n=== LFU КЭШ НА 3 ЗАПИСИ ===")
+    lfu = LFUCache(capacity=3)
+    for key in "ABC":
+        lfu.put(key, key.lower())
+    for key in "AACCB":
+        lfu.get(key)
+    lfu.put("D", "d")  # Вытесняется B - к ней обращались реже всего
+    print(f"Кэш: {lfu}")
+    print(f"Статистика: {lfu.stats()}")
+
+    print("\n=== МЕМОИЗАЦИЯ С ВРЕМЕНЕМ ЖИЗНИ ===")
+
+    @memoize(capacity=100, ttl=60)
+    def fibonacci(n):
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+    print(f"fibonacci(80) = {fibonacci(80)}")
+    print(f"Статистика: {fibonacci.cache.stats()}")
+
+
+if __name__ == "__main__":
+    demo_cache()
@@ -0,0 +1,299 @@
+"""
+Потокобезопасная и асинхронная очереди на основе двунаправленного списка
+Для связи стадий конвейера: блокирующее ожидание вместо опроса is_empty()
+"""
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+
+from main import QueueUsingDLL
+
+
+class BlockingQueueUsingDLL(QueueUsingDLL):
+    """Потокобезопасная ограниченная очередь с блокирующими операциями
+
+    maxsize <= 0 означает очередь без ограничения размера.
+    """
+
+    def __init__(self, maxsize=0):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def _full(self):
+        return 0 < self.maxsize <= len(self.dll)
+
+    def enqueue(self, data, block=True, timeout=None):
+        """Добавление элемента, при заполненной очереди - ожидание места"""
+        with self._not_full:
+            if self._full():
+                if not block:
+                    raise queue.Full
+                if not self._not_full.wait_for(lambda: not self._full(), timeout):
+                    raise queue.Full
+            self.dll.append(data)
+            self._not_empty.notify()
+
+    def dequeue(self, block=True, timeout=None):
+        """Извлечение элемента, при пустой очереди - ожидание элемента"""
+        with self._not_empty:
+            if self.dll.is_empty():
+                if not block:
+                    raise queue.Empty
+                if not self._not_empty.wait_for(lambda: not self.dll.is_empty(), timeout):
+                    raise queue.Empty
+            data = self.dll.popleft()
+            self._not_full.notify()
+            return data
+
+    def get_many(self, max_items, timeout=None):
+        """Извлечение до max_items элементов за одну блокировку
+
+        Ждет появления хотя бы одного элемента не дольше timeout,
+        по истечении времени возвращает пустой список.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: not self.dll.is_empty(), timeout):
+                return []
+            count = min(max_items, len(self.dll))
+            batch = self.dll.cut(0, count).to_list()
+            self._not_full.notify(count)
+            return batch
+
+    def front(self):
+        """Просмотр первого элемента без извлечения"""
+        with self._lock:
+            return super().front()
+
+    def contains(self, data):
+        """Проверка наличия элемента в очереди"""
+        with self._lock:
+            return super().contains(data)
+
+    def merge(self, other):
+        """Перенос всех элементов другой очереди в конец этой (без учета maxsize)
+
+        Если другая очередь тоже блокирующая, берутся обе блокировки в
+        порядке id, чтобы встречный merge не привел к взаимной блокировке,
+        и будятся ее производители, ждущие места.
+        """
+        if not isinstance(other, BlockingQueueUsingDLL) or other is self:
+            with self._lock:
+                super().merge(other)
+                self._not_empty.notify_all()
+            return
+
+        first, second = sorted((self, other), key=id)
+        with first._lock, second._lock:
+            super().merge(other)
+            self._not_empty.notify_all()
+            other._not_full.notify_all()
+
+    def rotate(self, k=1):
+        """Перенос k первых элементов в конец очереди"""
+        with self._lock:
+            super().rotate(k)
+
+    def is_empty(self):
+        with self._lock:
+            return self.dll.is_empty()
+
+    def __len__(self):
+        with self._lock:
+            return len(self.dll)
+
+    def __str__(self):
+        with self._lock:
+            return str(self.dll)
+
+
+class AsyncQueueUsingDLL(QueueUsingDLL):
+    """Очередь для asyncio с ожиданием через await put/get
+
+    Синхронные enqueue/dequeue не ждут и работают как put_nowait/get_nowait.
+    """
+
+    def __init__(self, maxsize=0):
+        super().__init__()
+        self.maxsize = maxsize
+        self._getters = deque()  # Ожидающие появления элемента
+        self._putters = deque()  # Ожидающие освобождения места
+
+    def _full(self):
+        return 0 < self.maxsize <= len(self.dll)
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        """Пробуждение первого еще ожидающего"""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters, blocked):
+        """Ожидание, пока условие blocked() не перестанет выполняться"""
+        loop = asyncio.get_running_loop()
+        while blocked():
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                # Если нас уже разбудили, пробуждение передается следующему
+                if not blocked() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    def enqueue(self, data):
+        """Добавление элемента без ожидания"""
+        if self._full():
+            raise asyncio.QueueFull
+        self.dll.append(data)
+        self._wakeup_next(self._getters)
+
+    def dequeue(self):
+        """Извлечение элемента без ожидания"""
+        data = super().dequeue()
+        self._wakeup_next(self._putters)
+        return data
+
+    async def put(self, data):
+        """Добавление элемента с ожиданием свободного места"""
+        await self._wait(self._putters, self._full)
+        self.enqueue(data)
+
+    async def get(self):
+        """Извлечение элемента с ожиданием его появления"""
+        await self._wait(self._getters, self.dll.is_empty)
+        return self.dequeue()
+
+    async def get_many(self, max_items, timeout=None):
+        """Извлечение до max_items элементов, ожидая первый не дольше timeout"""
+        try:
+            await asyncio.wait_for(self._wait(self._getters, self.dll.is_empty), timeout)
+        except asyncio.TimeoutError:
+            return []
+
+        count = min(max_items, len(self.dll))
+        batch = self.dll.cut(0, count).to_list()
+        for _ in range(count):
+            self._wakeup_next(self._putters)
+        return batch
+
+    def merge(self, other):
+        """Перенос всех элементов другой очереди в конец этой (без учета maxsize)"""
+        super().merge(other)
+        for _ in range(len(self._getters)):
+            self._wakeup_next(self._getters)
+        if isinstance(other, AsyncQueueUsingDLL):
+            for _ in range(len(other._putters)):
+                other._wakeup_next(other._putters)
+
+
+def benchmark_contention(total=200_000, producer_counts=(1, 2, 4, 8, 16), maxsize=1024, batch=256):
+    """Пропускная способность при конкуренции нескольких потоков-производителей"""
+    print("\n" + "=" * 60)
+    print(f"КОНКУРЕНЦИЯ ПОТОКОВ: {total} ЭЛЕМЕНТОВ, ОЧЕРЕДЬ НА {maxsize}")
+    print("=" * 60)
+
+    def run(make_queue, put, consume, producers):
+        channel = make_queue()
+        per_producer = total // producers
+
+        def produce():
+            for i in range(per_producer):
+                put(channel, i)
+
+        threads = [threading.Thread(target=produce) for _ in range(producers)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        consume(channel, per_producer * producers)
+        for thread in threads:
+            thread.join()
+        return per_producer * producers / (time.perf_counter() - start)
+
+    def consume_one(channel, expected):
+        for _ in range(expected):
+            channel.dequeue()
+
+    def consume_batches(channel, expected):
+        received = 0
+        while received < expected:
+            received += len(channel.get_many(batch, timeout=1.0))
+
+    def consume_stdlib(channel, expected):
+        for _ in range(expected):
+            channel.get()
+
+    for producers in producer_counts:
+        dll_rate = run(lambda: BlockingQueueUsingDLL(maxsize),
+                       BlockingQueueUsingDLL.enqueue, consume_one, producers)
+        batch_rate = run(lambda: BlockingQueueUsingDLL(maxsize),
+                         BlockingQueueUsingDLL.enqueue, consume_batches, producers)
+        stdlib_rate = run(lambda: queue.Queue(maxsize),
+                          queue.Queue.put, consume_stdlib, producers)
+        print(f"производителей: {producers:>2} | dequeue: {dll_rate / 1e3:7.1f} тыс/с | "
+              f"get_many: {batch_rate / 1e3:7.1f} тыс/с | queue.Queue: {stdlib_rate / 1e3:7.1f} тыс/с")
+
+
+async def demo_async_queue():
+    """Демонстрация асинхронной очереди между двумя корутинами"""
+    print("\n=== АСИНХРОННАЯ ОЧЕРЕДЬ ===")
+    channel = AsyncQueueUsingDLL(maxsize=2)
+
+    async def producer():
+        for item in "ABCDE":
+            await channel.put(item)
+        await channel.put(None)
+
+    async def consumer():
+        received = []
+        while True:
+            batch = await channel.get_many(10, timeout=1.0)
+            if None in batch:
+                received.extend(batch[:-1])
+                return received
+            received.extend(batch)
+
+    _, received = await asyncio.gather(producer(), consumer())
+    print(f"Получено потребителем: {received}")
+
+
+def demo_blocking_queue():
+    """Демонстрация потокобезопасной очереди"""
+    print("=== ПОТОКОБЕЗОПАСНАЯ ОЧЕРЕДЬ ===")
+    channel = BlockingQueueUsingDLL(maxsize=3)
+
+    def producer():
+        for i in range(10):
+            channel.enqueue(i)  # Ждет, пока потребитель освободит место
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    received = []
+    while len(received) < 10:
+        received.extend(channel.get_many(4, timeout=1.0))
+    thread.join()
+    print(f"Получено: {received}")
+
+    try:
+        channel.dequeue(timeout=0.1)
+    except queue.Empty:
+        print("Очередь пуста: ожидание завершилось по таймауту")
+
+
+if __name__ == "__main__":
+    demo_blocking_queue()
+    asyncio.run(demo_async_queue())
+    benchmark_contention()
@@ -0,0 +1,465 @@
+"""
+Двунаправленный список на диске
+Узлы - записи фиксированного размера в отображаемом в память файле,
+данные - в отдельном файле-куче, в конец которого они только дописываются
+"""
+import mmap
+import os
+import pickle
+import shutil
+import struct
+import tempfile
+import time
+import tracemalloc
+import zlib
+
+from main import DoublyLinkedList
+
+NIL = -1  # Отсутствующая связь
+DISK_MAGIC = b"DLLD"
+FLIPPED = 1  # Флаг заголовка: список развернут, роли prev и next поменялись
+
+# Заголовок: сигнатура, флаги, поколение, head, tail, length,
+# выданные ячейки, начало списка свободных ячеек, размер кучи
+DISK_HEADER = struct.Struct("<4sIQqqqqqq")
+HEADER_CRC = struct.Struct("<I")
+HEADER_SLOT = 72  # Заголовок с контрольной суммой и выравниванием
+RECORDS_START = 2 * HEADER_SLOT  # Две копии заголовка, затем записи узлов
+
+# Запись узла: prev, next, смещение и размер данных в куче, связь списка свободных
+RECORD = struct.Struct("<qqqqq")
+LINKS = struct.Struct("<qqqq")
+FIELD = struct.Struct("<q")
+PREV, NEXT, OFFSET, SIZE, FREE_LINK = range(5)
+
+
+class DiskDoublyLinkedList:
+    """Двунаправленный список, хранящийся в файлах path и path + '.heap'
+
+    Повторное открытие читает только заголовок, а обход подгружает лишь
+    затронутые записи узлов и данные. Изменения становятся постоянными
+    после sync() или close().
+
+    Заголовок хранится в двух копиях с поколением и CRC32, новая копия
+    пишется на место старой, поэтому после сбоя всегда найдется целая.
+    Обход ограничен длиной из заголовка, а освобожденные ячейки и место
+    в куче не переиспользуются до sync(). Поэтому после сбоя список
+    открывается в состоянии последнего sync(), если с тех пор элементы
+    добавлялись только к тем концам, с которых их не извлекали (например,
+    append и popleft, как в очереди). reverse и clear сразу сохраняют
+    состояние на диск, поэтому тоже не мешают восстановлению.
+    Остальные изменения правят связи сохраненных узлов на месте.
+    """
+
+    def __init__(self, path, capacity=1024):
+        self.path = path
+        exists = os.path.exists(path) and os.path.getsize(path) >= RECORDS_START
+        mode = "r+b" if exists else "w+b"
+        self._file = open(path, mode)
+        self._heap = open(path + ".heap", mode)
+        if not exists:
+            self._file.truncate(RECORDS_START + max(capacity, 1) * RECORD.size)
+        self._map()
+        self._pending = []  # Ячейки, освобожденные после последнего sync()
+
+        if exists:
+            self._load_header()
+        else:
+            self._flags = 0
+            self._generation = 0
+            self.head = NIL
+            self.tail = NIL
+            self.length = 0
+            self._used = 0  # Количество когда-либо выданных ячеек
+            self._free = NIL  # Список свободных ячеек через поле FREE_LINK
+            self._heap_size = 0
+            self._commit()
+            self._commit()  # Обе копии заголовка должны быть целыми
+        self._set_direction()
+
+    def _map(self):
+        """Отображение файла узлов в память"""
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self._capacity = (len(self._mm) - RECORDS_START) // RECORD.size
+
+    def _set_direction(self):
+        """Поля записи, играющие роль next и prev с учетом разворота"""
+        if self._flags & FLIPPED:
+            self._fwd, self._bwd = PREV, NEXT
+        else:
+            self._fwd, self._bwd = NEXT, PREV
+
+    def _load_header(self):
+        """Чтение самой свежей целой копии заголовка"""
+        best = None
+        for copy_index in range(2):
+            base = copy_index * HEADER_SLOT
+            fields = DISK_HEADER.unpack_from(self._mm, base)
+            (crc,) = HEADER_CRC.unpack_from(self._mm, base + DISK_HEADER.size)
+            if fields[0] != DISK_MAGIC or crc != zlib.crc32(self._mm[base:base + DISK_HEADER.size]):
+                continue
+            if best is None or fields[2] > best[2]:
+                best = fields
+
+        if best is None:
+            raise ValueError("No valid DiskDoublyLinkedList header")
+
+        (_, self._flags, self._generation, self.head, self.tail,
+         self.length, self._used, self._free, self._heap_size) = best
+
+    def _commit(self):
+        """Запись заголовка в копию со старшим поколением"""
+        self._generation += 1
+        base = (self._generation % 2) * HEADER_SLOT
+        packed = DISK_HEADER.pack(DISK_MAGIC, self._flags, self._generation, self.head,
+                                  self.tail, self.length, self._used, self._free, self._heap_size)
+        self._mm[base:base + DISK_HEADER.size] = packed
+        HEADER_CRC.pack_into(self._mm, base + DISK_HEADER.size, zlib.crc32(packed))
+        self._mm.flush()
+
+    def sync(self):
+        """Сохранение всех изменений на диск"""
+        for slot in self._pending:
+            self._set(slot, FREE_LINK, self._free)
+            self._free = slot
+        self._pending = []
+
+        self._heap.flush()
+        os.fsync(self._heap.fileno())
+        self._mm.flush()
+        self._commit()
+
+    def close(self):
+        """Сохранение изменений и закрытие файлов"""
+        if self._mm.closed:
+            return
+        self.sync()
+        self._mm.close()
+        self._file.close()
+        self._heap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get(self, slot, field):
+        """Чтение поля записи узла"""
+        return FIELD.unpack_from(self._mm, RECORDS_START + slot * RECORD.size + field * FIELD.size)[0]
+
+    def _set(self, slot, field, value):
+        """Запись поля записи узла"""
+        FIELD.pack_into(self._mm, RECORDS_START + slot * RECORD.size + field * FIELD.size, value)
+
+    def _grow(self):
+        """Увеличение файла узлов в два раза"""
+        self._mm.flush()
+        self._mm.close()
+        self._file.truncate(RECORDS_START + 2 * self._capacity * RECORD.size)
+        self._map()
+
+    def _alloc(self, data):
+        """Запись данных в кучу и выделение ячейки под узел"""
+        payload = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        if self._free != NIL:
+            slot = self._free
+            self._free = self._get(slot, FREE_LINK)
+        else:
+            if self._used == self._capacity:
+                self._grow()
+            slot = self._used
+            self._used += 1
+
+        self._heap.seek(self._heap_size)
+        self._heap.write(payload)
+        # Поле FREE_LINK не трогаем: по нему идет список свободных из заголовка на диске
+        LINKS.pack_into(self._mm, RECORDS_START + slot * RECORD.size,
+                        NIL, NIL, self._heap_size, len(payload))
+        self._heap_size += len(payload)
+        return slot
+
+    def _payload(self, slot):
+        """Чтение данных узла из кучи"""
+        offset = self._get(slot, OFFSET)
+        self._heap.seek(offset)
+        return pickle.loads(self._heap.read(self._get(slot, SIZE)))
+
+    def _slots(self, start, field):
+        """Номера ячеек от start по полю field, не больше length штук"""
+        slot = start
+        for _ in range(self.length - 1):
+            yield slot
+            slot = self._get(slot, field)
+        if self.length:
+            yield slot
+
+    def __str__(self):
+        """Строковое представление списка"""
+        return "[" + " <-> ".join(str(item) for item in self) + "]"
+
+    def __len__(self):
+        """Возвращает длину списка"""
+        return self.length
+
+    def is_empty(self):
+        """Проверка на пустоту списка"""
+        return self.length == 0
+
+    def append(self, data):
+        """Добавление элемента в конец списка"""
+        slot = self._alloc(data)
+        if self.length == 0:
+            self.head = slot
+        else:
+            self._set(self.tail, self._fwd, slot)
+            self._set(slot, self._bwd, self.tail)
+        self.tail = slot
+        self.length += 1
+
+    def prepend(self, data):
+        """Добавление элемента в начало списка"""
+        slot = self._alloc(data)
+        if self.length == 0:
+            self.tail = slot
+        else:
+            self._set(self.head, self._bwd, slot)
+            self._set(slot, self._fwd, self.head)
+        self.head = slot
+        self.length += 1
+
+    def appendleft(self, data):
+        """Добавление элемента в начало списка (как в deque)"""
+        self.prepend(data)
+
+    def insert(self, index, data):
+        """Вставка элемента в произвольную позицию"""
+        if index < 0 or index > self.length:
+            raise IndexError("Index out of range")
+
+        if index == 0:
+            self.prepend(data)
+            return
+
+        if index == self.length:
+            self.append(data)
+            return
+
+        current = self._get_node(index)
+        before = self._get(current, self._bwd)
+        slot = self._alloc(data)
+
+        self._set(slot, self._bwd, before)
+        self._set(slot, self._fwd, current)
+        self._set(before, self._fwd, slot)
+        self._set(current, self._bwd, slot)
+        self.length += 1
+
+    def _get_node(self, index):
+        """Получение номера ячейки по индексу (вспомогательный метод)"""
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of range")
+
+        if index < self.length // 2:
+            slot = self.head
+            for _ in range(index):
+                slot = self._get(slot, self._fwd)
+        else:
+            slot = self.tail
+            for _ in range(self.length - 1 - index):
+                slot = self._get(slot, self._bwd)
+
+        return slot
+
+    def get(self, index):
+        """Получение элемента по индексу"""
+        return self._payload(self._get_node(index))
+
+    def _unlink(self, slot):
+        """Исключение узла из цепочки (ячейка освободится при sync())"""
+        data = self._payload(slot)
+
+        if self.length == 1:
+            self.head = NIL
+            self.tail = NIL
+        elif slot == self.head:
+            self.head = self._get(slot, self._fwd)
+        elif slot == self.tail:
+            self.tail = self._get(slot, self._bwd)
+        else:
+            before = self._get(slot, self._bwd)
+            after = self._get(slot, self._fwd)
+            self._set(before, self._fwd, after)
+            self._set(after, self._bwd, before)
+
+        self.length -= 1
+        self._pending.append(slot)
+        return data
+
+    def remove(self, index):
+        """Удаление элемента по индексу"""
+        return self._unlink(self._get_node(index))
+
+    def pop(self):
+        """Извлечение последнего элемента"""
+        if self.length == 0:
+            raise IndexError("List is empty")
+        return self._unlink(self.tail)
+
+    def popleft(self):
+        """Извлечение первого элемента"""
+        if self.length == 0:
+            raise IndexError("List is empty")
+        return self._unlink(self.head)
+
+    def peek(self):
+        """Последний элемент без извлечения"""
+        if self.length == 0:
+            raise IndexError("List is empty")
+        return self._payload(self.tail)
+
+    def peekleft(self):
+        """Первый элемент без извлечения"""
+        if self.length == 0:
+            raise IndexError("List is empty")
+        return self._payload(self.head)
+
+    def remove_value(self, data):
+        """Удаление первого вхождения элемента по значению"""
+        for slot in self._slots(self.head, self._fwd):
+            if self._payload(slot) == data:
+                self._unlink(slot)
+                return True
+        return False
+
+    def index_of(self, data):
+        """Поиск индекса элемента (первого вхождения)"""
+        for index, item in enumerate(self):
+            if item == data:
+                return index
+        return -1
+
+    def contains(self, data):
+        """Проверка наличия элемента в списке"""
+        return self.index_of(data) != -1
+
+    def clear(self):
+        """Очистка списка (сразу сохраняется на диск)"""
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+        self._used = 0
+        self._free = NIL
+        self._heap_size = 0
+        self._pending = []
+        # Пустое состояние фиксируется до того, как старые данные будут перезаписаны
+        self._commit()
+        self._heap.truncate(0)
+
+    def reverse(self):
+        """Разворот списка (сразу сохраняется на диск)
+
+        В заголовке меняется роль полей prev и next, связи узлов не
+        трогаются. Разворот фиксируется через sync(): иначе последующие
+        операции с концами правили бы связи узлов последнего сохраненного
+        состояния, прочитанные уже в другом направлении.
+        """
+        self._flags ^= FLIPPED
+        self._set_direction()
+        self.head, self.tail = self.tail, self.head
+        self.sync()
+
+    def to_list(self):
+        """Преобразование в обычный список Python"""
+        return list(self)
+
+    def from_list(self, data_list):
+        """Создание списка из обычного списка Python"""
+        self.clear()
+        self.extend(data_list)
+
+    def extend(self, iterable):
+        """Добавление элементов в конец списка"""
+        for item in iterable:
+            self.append(item)
+
+    def __iter__(self):
+        """Итератор для списка (данные читаются с диска по мере обхода)"""
+        for slot in self._slots(self.head, self._fwd):
+            yield self._payload(slot)
+
+    def iterate_backward(self):
+        """Итерация в обратном порядке"""
+        for slot in self._slots(self.tail, self._bwd):
+            yield self._payload(slot)
+
+
+def benchmark_disk_list(size=1_000_000):
+    """Запись, повторное открытие и обход списка на диске"""
+    print("\n" + "=" * 60)
+    print(f"СПИСОК НА ДИСКЕ: {size} ЭЛЕМЕНТОВ")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "queue.dll")
+
+        start = time.perf_counter()
+        with DiskDoublyLinkedList(path) as dll:
+            dll.extend(range(size))
+        print(f"Запись и sync(): {time.perf_counter() - start:.2f} с")
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        dll = DiskDoublyLinkedList(path)
+        reopen_time = time.perf_counter() - start
+        first = [dll.popleft() for _ in range(10)]
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"Повторное открытие: {reopen_time * 1e3:.2f} мс, первые элементы {first}, "
+              f"пик памяти {peak / 1024:.0f} КБ")
+
+        start = time.perf_counter()
+        total = sum(dll)
+        print(f"Полный обход: {time.perf_counter() - start:.2f} с (сумма {total})")
+        dll.close()
+
+    memory = DoublyLinkedList()
+    tracemalloc.start()
+    memory.extend(range(size))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"DoublyLinkedList в памяти для сравнения: {current / 2 ** 20:.0f} МБ")
+
+
+def demo_disk_list():
+    """Демонстрация сохранения списка между открытиями"""
+    print("=== СПИСОК НА ДИСКЕ ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.dll")
+
+        with DiskDoublyLinkedList(path) as dll:
+            dll.from_list(["загрузка", "разбор", {"шаг": 3}, ("итог", 4)])
+            dll.insert(1, "проверка")
+            dll.reverse()
+        print("Список сохранен и закрыт")
+
+        dll = DiskDoublyLinkedList(path)
+        print(f"После повторного открытия: {dll}")
+        dll.reverse()
+        dll.sync()
+        dll.append("не сохранено")
+        dll.popleft()
+
+        # Копия файлов без sync() - то же, что останется на диске после сбоя
+        for suffix in ("", ".heap"):
+            shutil.copyfile(path + suffix, path + ".crash" + suffix)
+        with DiskDoublyLinkedList(path + ".crash") as recovered:
+            print(f"Состояние без sync() (как после сбоя): {recovered}")
+        print(f"Текущее состояние: {dll}")
+        dll.close()
+
+
+if __name__ == "__main__":
+    demo_disk_list()
+    benchmark_disk_list()
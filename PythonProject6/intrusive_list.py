@@ -0,0 +1,211 @@
+"""
+Интрузивный двунаправленный список
+Объекты сами хранят связи prev/next, поэтому отдельный Node на элемент не создается
+"""
+import tracemalloc
+
+from main import DoublyLinkedList
+
+
+class ListHook:
+    """Примесь для объектов, которые сами являются узлами списка"""
+
+    __slots__ = ('prev', 'next', 'owner')
+
+    def __init__(self):
+        self.prev = None
+        self.next = None
+        self.owner = None  # Список, в который встроен объект
+
+    @property
+    def data(self):
+        """Данные узла - сам объект"""
+        return self
+
+
+class IntrusiveDoublyLinkedList(DoublyLinkedList):
+    """Двунаправленный список, в который объекты встраиваются сами
+
+    Встраивать можно только объекты классов с ListHook в предках.
+    Объект может одновременно находиться только в одном списке: список
+    записывает себя в owner объекта и сбрасывает его при исключении.
+    """
+
+    _intrusive = True
+
+    @staticmethod
+    def _check_free(obj):
+        """Проверка, что объект можно встроить"""
+        if not isinstance(obj, ListHook):
+            raise TypeError(f"{type(obj).__name__} objects must derive from ListHook")
+        if obj.owner is not None:
+            raise ValueError("Object is already linked into a list")
+
+    def _node_type(self, obj):
+        """Подготовка объекта к встраиванию вместо создания узла"""
+        self._check_free(obj)
+        obj.owner = self
+        return obj
+
+    def _adopt(self, first):
+        """Запись этого списка владельцем объектов цепочки, начиная с first"""
+        current = first
+        while current is not None:
+            current.owner = self
+            current = current.next
+
+    def _unlink(self, node):
+        """Исключение объекта из цепочки со сбросом его связей"""
+        data = super()._unlink(node)
+        node.prev = None
+        node.next = None
+        node.owner = None
+        return data
+
+    def unlink(self, obj):
+        """Исключение объекта из списка за O(1) без поиска"""
+        if not isinstance(obj, ListHook) or obj.owner is not self:
+            raise ValueError("Object is not in the list")
+
+        self._normalize()
+        self._unlink(obj)
+
+    def extend(self, iterable):
+        """Встраивание объектов в конец списка
+
+        Объекты проверяются заранее, поэтому при ошибке не встраивается ни один.
+        """
+        items = list(iterable)
+        seen = set()
+        for obj in items:
+            self._check_free(obj)
+            if id(obj) in seen:
+                raise ValueError("Object is already linked into a list")
+            seen.add(id(obj))
+        super().extend(items)
+
+    def splice(self, other, index):
+        """Перенос всех объектов другого интрузивного списка в позицию index"""
+        first = other.head
+        super().splice(other, index)
+        # Цепочка другого списка заканчивается перед прежним узлом index
+        current = first
+        while current is not None and current.owner is other:
+            current.owner = self
+            current = current.next
+
+    def merge(self, other, key=None, reverse=False):
+        """Слияние с другим отсортированным интрузивным списком"""
+        super().merge(other, key, reverse)
+        self._adopt(self.head)
+
+    def cut(self, start, stop):
+        """Вырезание объектов [start, stop) в новый интрузивный список"""
+        result = super().cut(start, stop)
+        result._adopt(result.head)
+        return result
+
+    def _extract(self, test):
+        """Перенос объектов, проходящих test, в новый интрузивный список"""
+        moved = []
+
+        def matches(obj):
+            if test(obj):
+                moved.append(obj)
+                return True
+            return False
+
+        try:
+            result = super()._extract(matches)
+        except BaseException:
+            # Уже перенесенные объекты остались в потерянном списке-результате
+            for obj in moved:
+                obj.prev = None
+                obj.next = None
+                obj.owner = None
+            raise
+
+        for obj in moved:
+            obj.owner = result
+        return result
+
+    def clear(self):
+        """Очистка списка со сбросом связей всех объектов"""
+        current = self.head
+        while current is not None:
+            following = current.next
+            current.prev = None
+            current.next = None
+            current.owner = None
+            current = following
+        super().clear()
+
+    # Объект не может быть сразу в двух списках, а его связи нельзя
+    # копировать поэлементно, поэтому копирование и pickle запрещены
+    def __copy__(self):
+        raise TypeError("Intrusive list cannot be copied")
+
+    def __deepcopy__(self, memo):
+        raise TypeError("Intrusive list cannot be copied")
+
+    def __reduce__(self):
+        raise TypeError("Intrusive list cannot be pickled")
+
+
+class Session(ListHook):
+    """Пример объекта-узла: сессия пользователя"""
+
+    __slots__ = ('user', 'token')
+
+    def __init__(self, user, token):
+        super().__init__()
+        self.user = user
+        self.token = token
+
+    def __str__(self):
+        return f"{self.user}({self.token})"
+
+
+def compare_memory(size=100_000):
+    """Сравнение памяти под список сессий: обертки Node против встраивания"""
+    print("\n" + "=" * 60)
+    print(f"ПАМЯТЬ ПОД СПИСОК ИЗ {size} СЕССИЙ")
+    print("=" * 60)
+
+    sessions = [Session(f"user{i}", i) for i in range(size)]
+
+    for name, container in (("DoublyLinkedList", DoublyLinkedList()),
+                            ("IntrusiveDoublyLinkedList", IntrusiveDoublyLinkedList())):
+        tracemalloc.start()
+        container.extend(sessions)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:>26}: {current / size:6.1f} байт на элемент сверх самих объектов")
+        container.clear()
+
+
+def demo_intrusive_list():
+    """Демонстрация интрузивного списка"""
+    print("=== ИНТРУЗИВНЫЙ СПИСОК СЕССИЙ ===")
+
+    sessions = [Session(user, token) for token, user in enumerate(["anna", "boris", "vera", "gleb"])]
+    active = IntrusiveDoublyLinkedList()
+    active.extend(sessions)
+    print(f"Активные сессии: {active}")
+
+    active.unlink(sessions[1])  # Без поиска индекса
+    print(f"После завершения сессии {sessions[1]}: {active}")
+
+    expired = IntrusiveDoublyLinkedList()
+    expired.append(sessions[1])  # После unlink объект можно встроить в другой список
+    print(f"Завершенные сессии: {expired}")
+
+    try:
+        expired.append(sessions[0])
+    except ValueError as error:
+        print(f"Повторная вставка: {error}")
+
+
+if __name__ == "__main__":
+    demo_intrusive_list()
+    compare_memory()
@@ -0,0 +1,229 @@
+"""
+Двунаправленный список с разворотом за O(1)
+Разворот только меняет флаг направления, а методы читают связи через него
+"""
+import time
+
+from main import DoublyLinkedList
+
+
+class LazyReverseList(DoublyLinkedList):
+    """Двунаправленный список с ленивым разворотом
+
+    При поднятом флаге логическое начало списка - это физический tail,
+    а логическая связь next - это физическая связь prev.
+    """
+
+    def __init__(self, indexed=False, maxlen=None):
+        super().__init__(indexed=indexed, maxlen=maxlen)
+        self._flipped = False
+
+    def __str__(self):
+        """Строковое представление списка"""
+        return "[" + " <-> ".join(str(item) for item in self) + "]"
+
+    def reverse(self):
+        """Разворот списка за O(1)"""
+        self._flipped = not self._flipped
+        self._version += 1
+
+    def _normalize(self):
+        """Физический разворот связей, после которого флаг снят"""
+        if self._flipped:
+            super().reverse()
+            self._flipped = False
+
+    def append(self, data):
+        """Добавление элемента в конец списка"""
+        if self._flipped:
+            super().prepend(data)
+        else:
+            super().append(data)
+
+    def prepend(self, data):
+        """Добавление элемента в начало списка"""
+        if self._flipped:
+            super().append(data)
+        else:
+            super().prepend(data)
+
+    def insert(self, index, data):
+        """Вставка элемента в произвольную позицию"""
+        if not self._flipped:
+            super().insert(index, data)
+            return
+
+        if index < 0 or index > self.length:
+            raise IndexError("Index out of range")
+
+        if index == 0:
+            self.prepend(data)
+            return
+
+        if index == self.length:
+            self.append(data)
+            return
+
+        self._check_room(1)
+        # Вставка перед логическим элементом - это вставка после физического
+        new_node = self._node_type(data)
+        current = self._get_node(index)
+
+        new_node.prev = current
+        new_node.next = current.next
+        current.next.prev = new_node
+        current.next = new_node
+
+        self.length += 1
+        self._version += 1
+        if self._index is not None:
+            self._index_add(new_node)
+
+    def pop(self):
+        """Извлечение последнего элемента за O(1)"""
+        return super().popleft() if self._flipped else super().pop()
+
+    def popleft(self):
+        """Извлечение первого элемента за O(1)"""
+        return super().pop() if self._flipped else super().popleft()
+
+    def peek(self):
+        """Последний элемент без извлечения"""
+        return super().peekleft() if self._flipped else super().peek()
+
+    def peekleft(self):
+        """Первый элемент без извлечения"""
+        return super().peek() if self._flipped else super().peekleft()
+
+    def rotate(self, k=1):
+        """Циклический сдвиг без нормализации: при флаге физическая цепочка сдвигается влево"""
+        self._rotate_chain(-k if self._flipped else k)
+
+    def _get_node(self, index):
+        """Получение узла по логическому индексу"""
+        if self._flipped:
+            index = self.length - 1 - index
+        return super()._get_node(index)
+
+    def remove_value(self, data):
+        """Удаление первого вхождения элемента по значению"""
+        if not self._flipped:
+            return super().remove_value(data)
+
+        candidates = self._candidates(data)
+        if candidates is not None and len(candidates) <= 1:
+            return super().remove_value(data)
+
+        current = self.tail
+        while current:
+            if current.data == data:
+                self._unlink(current)
+                return True
+            current = current.prev
+
+        return False
+
+    def index_of(self, data):
+        """Поиск индекса элемента (первого вхождения)"""
+        if not self._flipped:
+            return super().index_of(data)
+
+        candidates = self._candidates(data)
+        if candidates is not None and not candidates:
+            return -1
+
+        for index, item in enumerate(self):
+            if item == data:
+                return index
+        return -1
+
+    def extend(self, iterable):
+        """Добавление элементов в конец списка без нормализации связей"""
+        if not self._flipped:
+            super().extend(iterable)
+            return
+
+        # Цепочка собирается задом наперед и присоединяется к физическому head
+        first = None
+        last = None
+        count = 0
+        for item in iterable:
+            new_node = self._node_type(item)
+            if first is None:
+                last = new_node
+            else:
+                new_node.next = first
+                first.prev = new_node
+            first = new_node
+            count += 1
+
+        if first is not None:
+            self._link_chain(first, last, self.head)
+            self.length += count
+            self._index_chain(first, last)
+            if self.maxlen is not None:
+                self._bound(False)
+
+    def clear(self):
+        """Очистка списка"""
+        super().clear()
+        self._flipped = False
+
+    def to_list(self):
+        """Преобразование в обычный список Python"""
+        return list(self)
+
+    def __iter__(self):
+        """Итератор для списка"""
+        if self._flipped:
+            return super().iterate_backward()
+        return super().__iter__()
+
+    def iterate_backward(self):
+        """Итерация в обратном порядке"""
+        if self._flipped:
+            return super().__iter__()
+        return super().iterate_backward()
+
+
+def benchmark_reverse(size=100_000, flips=100):
+    """Сравнение стоимости разворота с обычным DoublyLinkedList"""
+    print("\n" + "=" * 60)
+    print(f"РАЗВОРОТ СПИСКА ИЗ {size} ЭЛЕМЕНТОВ {flips} РАЗ")
+    print("=" * 60)
+
+    for name, factory in (("DoublyLinkedList", DoublyLinkedList),
+                          ("LazyReverseList", LazyReverseList)):
+        container = factory()
+        container.from_list(range(size))
+
+        start = time.perf_counter()
+        for _ in range(flips):
+            container.reverse()
+            container.append(0)
+        elapsed = time.perf_counter() - start
+
+        print(f"{name:>18}: {elapsed * 1e6 / flips:10.1f} мкс на разворот")
+
+
+def demo_lazy_reverse():
+    """Демонстрация работы ленивого разворота"""
+    print("=== СПИСОК С ЛЕНИВЫМ РАЗВОРОТОМ ===")
+
+    dll = LazyReverseList()
+    dll.from_list([10, 20, 30, 40])
+    dll.reverse()
+    print(f"Список после разворота: {dll}")
+    dll.append(5)
+    dll.insert(1, 35)
+    print(f"После append(5) и insert(1, 35): {dll}")
+    print(f"Элемент с индексом 1: {dll.get(1)}")
+    print(f"Удаляем элемент с индексом 0: {dll.remove(0)}")
+    print(f"Обратный порядок: {list(dll.iterate_backward())}")
+    dll.reverse()
+    print(f"Список после повторного разворота: {dll}")
+
+
+if __name__ == "__main__":
+    demo_lazy_reverse()
+    benchmark_reverse()
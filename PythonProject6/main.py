@@ -1,3 +1,13 @@
+import copy
+import struct
+import sys
+from array import array
+
+# Заголовок двоичного формата: сигнатура, код типа array, число элементов
+BINARY_MAGIC = b"DLL1"
+BINARY_HEADER = struct.Struct("<4scQ")
+
+
 class Node:
     """Узел двунаправленного списка"""
 
@@ -13,10 +23,22 @@ class Node:
 class DoublyLinkedList:
     """Двунаправленный список"""
 
-    def __init__(self):
+    _node_type = Node  # Класс создаваемых узлов
+    _intrusive = False  # Узлы - объекты пользователя (см. intrusive_list)
+
+    def __init__(self, indexed=False, maxlen=None):
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be non-negative")
+
         self.head = None
         self.tail = None
         self.length = 0
+        # Ограничение длины: при добавлении с одного конца лишнее вытесняется с другого
+        self.maxlen = maxlen
+        # Индекс значение -> узлы для быстрого поиска (включается по желанию)
+        self._index = {} if indexed else None
+        self._unindexed = 0  # Количество узлов с нехешируемыми данными
+        self._version = 0  # Счетчик структурных изменений для курсоров
 
     def __str__(self):
         """Строковое представление списка"""
@@ -25,9 +47,9 @@ class DoublyLinkedList:
 
         result = "["
         current = self.head
-        while current:
+        while current is not None:
             result += str(current.data)
-            if current.next:
+            if current.next is not None:
                 result += " <-> "
             current = current.next
         result += "]"
@@ -43,7 +65,7 @@ class DoublyLinkedList:
 
     def append(self, data):
         """Добавление элемента в конец списка"""
-        new_node = Node(data)
+        new_node = self._node_type(data)
 
         if self.is_empty():
             self.head = new_node
@@ -54,10 +76,15 @@ class DoublyLinkedList:
             self.tail = new_node
 
         self.length += 1
+        self._version += 1
+        if self._index is not None:
+            self._index_add(new_node)
+        if self.maxlen is not None:
+            self._bound(True)
 
     def prepend(self, data):
         """Добавление элемента в начало списка"""
-        new_node = Node(data)
+        new_node = self._node_type(data)
 
         if self.is_empty():
             self.head = new_node
@@ -68,6 +95,11 @@ class DoublyLinkedList:
             self.head = new_node
 
         self.length += 1
+        self._version += 1
+        if self._index is not None:
+            self._index_add(new_node)
+        if self.maxlen is not None:
+            self._bound(False)
 
     def insert(self, index, data):
         """Вставка элемента в произвольную позицию"""
@@ -82,7 +114,8 @@ class DoublyLinkedList:
             self.append(data)
             return
 
-        new_node = Node(data)
+        self._check_room(1)
+        new_node = self._node_type(data)
         current = self._get_node(index)
 
         new_node.prev = current.prev
@@ -91,6 +124,51 @@ class DoublyLinkedList:
         current.prev = new_node
 
         self.length += 1
+        self._version += 1
+        if self._index is not None:
+            self._index_add(new_node)
+
+    def _index_add(self, node):
+        """Добавление узла в индекс значений
+
+        Корзина значения хранит узлы по id: узлами интрузивного списка
+        бывают объекты пользователя со своими __eq__ и __hash__.
+        """
+        try:
+            self._index.setdefault(node.data, {})[id(node)] = node
+        except TypeError:
+            self._unindexed += 1
+
+    def _index_discard(self, node):
+        """Удаление узла из индекса значений"""
+        try:
+            bucket = self._index[node.data]
+        except TypeError:
+            self._unindexed -= 1
+            return
+
+        del bucket[id(node)]
+        if not bucket:
+            del self._index[node.data]
+
+    def _bound(self, from_head):
+        """Вытеснение элементов сверх maxlen с физического начала (или конца)"""
+        while self.length > self.maxlen:
+            self._unlink(self.head if from_head else self.tail)
+
+    def _check_room(self, count):
+        """Проверка, что вставка count элементов не превысит maxlen"""
+        if self.maxlen is not None and self.length + count > self.maxlen:
+            raise IndexError("List is full")
+
+    def _candidates(self, data):
+        """Узлы с заданным значением из индекса (None - нужен обычный поиск)"""
+        if self._index is None or self._unindexed:
+            return None
+        try:
+            return self._index.get(data, {})
+        except TypeError:
+            return None
 
     def _get_node(self, index):
         """Получение узла по индексу (вспомогательный метод)"""
@@ -118,30 +196,200 @@ class DoublyLinkedList:
         if index < 0 or index >= self.length:
             raise IndexError("Index out of range")
 
-        node_to_remove = self._get_node(index)
-
-        if self.length == 1:
-            self.head = None
-            self.tail = None
-        elif index == 0:
-            self.head = node_to_remove.next
-            self.head.prev = None
-        elif index == self.length - 1:
-            self.tail = node_to_remove.prev
-            self.tail.next = None
+        return self._unlink(self._get_node(index))
+
+    def _unlink(self, node):
+        """Исключение узла из цепочки (вспомогательный метод)"""
+        if node.prev is not None:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+
+        if node.next is not None:
+            node.next.prev = node.prev
         else:
-            node_to_remove.prev.next = node_to_remove.next
-            node_to_remove.next.prev = node_to_remove.prev
+            self.tail = node.prev
 
         self.length -= 1
-        return node_to_remove.data
+        self._version += 1
+        if self._index is not None:
+            self._index_discard(node)
+        return node.data
+
+    def appendleft(self, data):
+        """Добавление элемента в начало списка (как в deque)"""
+        self.prepend(data)
+
+    def pop(self):
+        """Извлечение последнего элемента за O(1)"""
+        if self.tail is None:
+            raise IndexError("List is empty")
+        return self._unlink(self.tail)
+
+    def popleft(self):
+        """Извлечение первого элемента за O(1)"""
+        if self.head is None:
+            raise IndexError("List is empty")
+        return self._unlink(self.head)
+
+    def peek(self):
+        """Последний элемент без извлечения"""
+        if self.tail is None:
+            raise IndexError("List is empty")
+        return self.tail.data
+
+    def peekleft(self):
+        """Первый элемент без извлечения"""
+        if self.head is None:
+            raise IndexError("List is empty")
+        return self.head.data
+
+    def rotate(self, k=1):
+        """Циклический сдвиг вправо на k позиций (k < 0 - влево)
+
+        Точка разреза ищется с ближнего конца, затем перевешиваются только
+        связи head и tail, поэтому сдвиг стоит O(min(k, n - k)).
+        """
+        self._normalize()
+        self._rotate_chain(k)
+
+    def _rotate_chain(self, k):
+        """Циклический сдвиг физической цепочки вправо на k позиций"""
+        if self.length <= 1:
+            return
+
+        k %= self.length
+        if k == 0:
+            return
+
+        new_head = DoublyLinkedList._get_node(self, self.length - k)
+        new_tail = new_head.prev
+
+        self.tail.next = self.head
+        self.head.prev = self.tail
+        new_tail.next = None
+        new_head.prev = None
+
+        self.head = new_head
+        self.tail = new_tail
+        self._version += 1
+
+    def remove_value(self, data):
+        """Удаление первого вхождения элемента по значению"""
+        candidates = self._candidates(data)
+        if candidates is not None:
+            if not candidates:
+                return False
+            if len(candidates) == 1:
+                self._unlink(next(iter(candidates.values())))
+                return True
+
+        current = self.head
+        while current is not None:
+            if current.data == data:
+                self._unlink(current)
+                return True
+            current = current.next
+
+        return False
+
+    def _extract(self, test):
+        """Перенос узлов, данные которых проходят test, в новый список за один проход"""
+        self._normalize()
+        result = type(self)(indexed=self._index is not None)
+        first = None
+        last = None
+        count = 0
+
+        # Счетчики обновляются и при исключении в test, чтобы список остался целым
+        try:
+            current = self.head
+            while current is not None:
+                following = current.next
+                if test(current.data):
+                    if current.prev is not None:
+                        current.prev.next = following
+                    else:
+                        self.head = following
+
+                    if following is not None:
+                        following.prev = current.prev
+                    else:
+                        self.tail = current.prev
+
+                    if self._index is not None:
+                        self._index_discard(current)
+                        result._index_add(current)
+
+                    current.prev = last
+                    current.next = None
+                    if last is not None:
+                        last.next = current
+                    else:
+                        first = current
+                    last = current
+                    count += 1
+                current = following
+        finally:
+            if count:
+                self.length -= count
+                self._version += 1
+                result.head = first
+                result.tail = last
+                result.length = count
+                result._version += 1
+
+        return result
+
+    def remove_if(self, predicate):
+        """Удаление всех элементов, для которых predicate истинно
+
+        Возвращает удаленные элементы новым списком (узлы переносятся).
+        """
+        return self._extract(predicate)
+
+    def retain_if(self, predicate):
+        """Сохранение только элементов, для которых predicate истинно"""
+        return self._extract(lambda data: not predicate(data))
+
+    def remove_all(self, data):
+        """Удаление всех вхождений элемента"""
+        candidates = self._candidates(data)
+        if candidates is not None and not candidates:
+            return type(self)(indexed=True)
+        return self._extract(lambda item: item == data)
+
+    def dedupe(self):
+        """Удаление повторов с сохранением первых вхождений
+
+        Нехешируемые элементы сравниваются с уже встреченными перебором.
+        """
+        seen = set()
+        seen_unhashable = []
+
+        def repeated(data):
+            try:
+                if data in seen:
+                    return True
+                seen.add(data)
+            except TypeError:
+                if data in seen_unhashable:
+                    return True
+                seen_unhashable.append(data)
+            return False
+
+        return self._extract(repeated)
 
     def index_of(self, data):
         """Поиск индекса элемента (первого вхождения)"""
+        candidates = self._candidates(data)
+        if candidates is not None and not candidates:
+            return -1
+
         current = self.head
         index = 0
 
-        while current:
+        while current is not None:
             if current.data == data:
                 return index
             current = current.next
@@ -151,6 +399,9 @@ class DoublyLinkedList:
 
     def contains(self, data):
         """Проверка наличия элемента в списке"""
+        candidates = self._candidates(data)
+        if candidates is not None:
+            return bool(candidates)
         return self.index_of(data) != -1
 
     def clear(self):
@@ -158,6 +409,10 @@ class DoublyLinkedList:
         self.head = None
         self.tail = None
         self.length = 0
+        self._version += 1
+        if self._index is not None:
+            self._index = {}
+        self._unindexed = 0
 
     def reverse(self):
         """Разворот списка"""
@@ -165,7 +420,7 @@ class DoublyLinkedList:
             return
 
         current = self.head
-        while current:
+        while current is not None:
             temp = current.next
             current.next = current.prev
             current.prev = temp
@@ -174,12 +429,13 @@ class DoublyLinkedList:
 
 
         self.head, self.tail = self.tail, self.head
+        self._version += 1
 
     def to_list(self):
         """Преобразование в обычный список Python"""
         result = []
         current = self.head
-        while current:
+        while current is not None:
             result.append(current.data)
             current = current.next
         return result
@@ -187,24 +443,491 @@ class DoublyLinkedList:
     def from_list(self, data_list):
         """Создание списка из обычного списка Python"""
         self.clear()
-        for item in data_list:
-            self.append(item)
+        self.extend(data_list)
+
+    def extend(self, iterable):
+        """Добавление элементов в конец списка за один проход"""
+        first = None
+        last = None
+        count = 0
+
+        # Сначала собираем отдельную цепочку, затем присоединяем ее целиком
+        for item in iterable:
+            new_node = self._node_type(item)
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+                new_node.prev = last
+            last = new_node
+            count += 1
+
+        if first is not None:
+            self._link_chain(first, last, None)
+            self.length += count
+            # Индексируются только присоединенные узлы: если iterable упал
+            # на середине, недостроенная цепочка не должна остаться в индексе
+            self._index_chain(first, last)
+            if self.maxlen is not None:
+                self._bound(True)
+
+    def _link_chain(self, first, last, before):
+        """Вставка готовой цепочки first..last перед узлом before (None - в конец)"""
+        after = before.prev if before is not None else self.tail
+
+        first.prev = after
+        last.next = before
+
+        if after is not None:
+            after.next = first
+        else:
+            self.head = first
+
+        if before is not None:
+            before.prev = last
+        else:
+            self.tail = last
+
+        self._version += 1
+
+    def _index_chain(self, first, last):
+        """Добавление в индекс узлов присоединенной цепочки first..last"""
+        if self._index is None:
+            return
+        current = first
+        while True:
+            self._index_add(current)
+            if current is last:
+                break
+            current = current.next
+
+    def _link_node(self, node, before):
+        """Вставка одиночного узла перед узлом before (None - в конец)"""
+        self._link_chain(node, node, before)
+        self.length += 1
+        if self._index is not None:
+            self._index_add(node)
+
+    def _normalize(self):
+        """Приведение связей к порядку head -> tail (для подклассов)"""
+
+    def splice(self, other, index):
+        """Перенос всех узлов другого списка в позицию index без копирования"""
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError("Can only splice a DoublyLinkedList")
+        if other._intrusive != self._intrusive:
+            raise TypeError("Cannot move nodes between intrusive and regular lists")
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if index < 0 or index > self.length:
+            raise IndexError("Index out of range")
+
+        if other.is_empty():
+            return
+
+        self._check_room(other.length)
+        self._normalize()
+        other._normalize()
+
+        first = other.head
+        last = other.tail
+        count = other.length
+        DoublyLinkedList.clear(other)  # Узлы уже перешли в этот список
+
+        before = self._get_node(index) if index < self.length else None
+        self._link_chain(first, last, before)
+        self.length += count
+
+        self._index_chain(first, last)
+
+    def cut(self, start, stop):
+        """Вырезание элементов [start, stop) в новый список без копирования"""
+        if start < 0 or stop > self.length or start > stop:
+            raise IndexError("Index out of range")
+
+        self._normalize()
+        result = type(self)(indexed=self._index is not None)
+        if start == stop:
+            return result
+
+        first = self._get_node(start)
+        last = self._get_node(stop - 1)
+
+        if first.prev is not None:
+            first.prev.next = last.next
+        else:
+            self.head = last.next
+
+        if last.next is not None:
+            last.next.prev = first.prev
+        else:
+            self.tail = first.prev
+
+        first.prev = None
+        last.next = None
+        self.length -= stop - start
+        self._version += 1
+
+        result.head = first
+        result.tail = last
+        result.length = stop - start
+        result._version += 1
+
+        if self._index is not None:
+            current = first
+            while current is not None:
+                self._index_discard(current)
+                result._index_add(current)
+                current = current.next
+
+        return result
+
+    @staticmethod
+    def _precedes(key, reverse):
+        """Функция «a должен стоять строго раньше b» для заданного порядка"""
+        if key is None:
+            if reverse:
+                return lambda a, b: b < a
+            return lambda a, b: a < b
+        if reverse:
+            return lambda a, b: key(b) < key(a)
+        return lambda a, b: key(a) < key(b)
+
+    def sort(self, key=None, reverse=False):
+        """Устойчивая сортировка слиянием с перестановкой связей узлов"""
+        if self.length <= 1:
+            return
+
+        self._normalize()
+        if key is None:
+            if reverse:
+                def less(a, b):
+                    return b.data < a.data
+            else:
+                def less(a, b):
+                    return a.data < b.data
+        else:
+            # Ключ вычисляется один раз для каждого узла (по id узла, как в индексе)
+            keys = {}
+            current = self.head
+            while current is not None:
+                keys[id(current)] = key(current.data)
+                current = current.next
+
+            if reverse:
+                def less(a, b):
+                    return keys[id(b)] < keys[id(a)]
+            else:
+                def less(a, b):
+                    return keys[id(a)] < keys[id(b)]
+
+        head = self.head
+        dummy = Node(None)
+        width = 1
+        while width < self.length:
+            tail = dummy
+            current = head
+            while current is not None:
+                left = current
+                right = self._split_run(left, width)
+                current = self._split_run(right, width)
+
+                # Слияние двух отсортированных отрезков (по связям next)
+                while left is not None and right is not None:
+                    if less(right, left):
+                        tail.next = right
+                        right = right.next
+                    else:
+                        tail.next = left
+                        left = left.next
+                    tail = tail.next
+                tail.next = left if left is not None else right
+                while tail.next is not None:
+                    tail = tail.next
+            head = dummy.next
+            width *= 2
+
+        # Восстановление обратных связей за один проход
+        previous = None
+        current = head
+        while current is not None:
+            current.prev = previous
+            previous = current
+            current = current.next
+
+        self.head = head
+        self.tail = previous
+        self._version += 1
+
+    @staticmethod
+    def _split_run(node, width):
+        """Отрезание первых width узлов цепочки, возвращает остаток"""
+        for _ in range(width - 1):
+            if node is None:
+                return None
+            node = node.next
+        if node is None:
+            return None
+        rest = node.next
+        node.next = None
+        return rest
+
+    def insort(self, data, key=None, reverse=False):
+        """Вставка в отсортированный список с поиском места с ближнего конца
+
+        Указатели идут навстречу друг другу с обоих концов, поэтому место
+        находится за O(min(i, n - i)). Равные элементы остаются раньше нового.
+        """
+        self._check_room(1)
+        self._normalize()
+        precedes = self._precedes(key, reverse)
+
+        forward = self.head
+        backward = self.tail
+        while forward is not None:
+            if precedes(data, forward.data):
+                before = forward
+                break
+            if not precedes(data, backward.data):
+                before = backward.next
+                break
+            forward = forward.next
+            backward = backward.prev
+        else:
+            before = None
+
+        self._link_node(self._node_type(data), before)
+
+    def merge(self, other, key=None, reverse=False):
+        """Слияние с другим отсортированным списком за O(n + m) без копирования"""
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError("Can only merge a DoublyLinkedList")
+        if other._intrusive != self._intrusive:
+            raise TypeError("Cannot move nodes between intrusive and regular lists")
+        if other is self:
+            raise ValueError("Cannot merge a list with itself")
+
+        if other.is_empty():
+            return
+
+        self._check_room(other.length)
+        self._normalize()
+        other._normalize()
+        precedes = self._precedes(key, reverse)
+
+        left = self.head
+        right = other.head
+        right_tail = other.tail
+        count = other.length
+        DoublyLinkedList.clear(other)  # Узлы уже перешли в этот список
+
+        if self._index is not None:
+            current = right
+            while current is not None:
+                self._index_add(current)
+                current = current.next
+
+        dummy = Node(None)
+        tail = dummy
+        # При равенстве первым идет элемент этого списка (устойчивость)
+        while left is not None and right is not None:
+            if precedes(right.data, left.data):
+                node = right
+                right = right.next
+            else:
+                node = left
+                left = left.next
+            tail.next = node
+            node.prev = tail
+            tail = node
+
+        rest = left if left is not None else right
+        if rest is not None:
+            tail.next = rest
+            rest.prev = tail
+            tail = self.tail if rest is left else right_tail
+
+        self.head = dummy.next
+        self.head.prev = None
+        self.tail = tail
+        self.length += count
+        self._version += 1
+
+    # Сериализация: цепочка сворачивается в плоский список данных, поэтому
+    # pickle и deepcopy не уходят в рекурсию по связям next/prev
+    def __getstate__(self):
+        return {"items": self.to_list(), "indexed": self._index is not None,
+                "maxlen": self.maxlen}
+
+    def __setstate__(self, state):
+        self.__init__(indexed=state["indexed"], maxlen=state.get("maxlen"))
+        self.extend(state["items"])
+
+    def __reduce__(self):
+        return type(self), (), self.__getstate__()
+
+    def __copy__(self):
+        result = type(self)(indexed=self._index is not None, maxlen=self.maxlen)
+        result.extend(self)
+        return result
+
+    def __deepcopy__(self, memo):
+        result = type(self)(indexed=self._index is not None, maxlen=self.maxlen)
+        memo[id(self)] = result
+        result.extend(copy.deepcopy(item, memo) for item in self)
+        return result
+
+    def dump_binary(self, file):
+        """Компактная запись списка только из int или только из float"""
+        items = self.to_list()
+        if all(type(item) is int for item in items):
+            typecode = "q"
+        elif all(type(item) is float for item in items):
+            typecode = "d"
+        else:
+            raise TypeError("Binary dump supports lists of only int or only float")
+
+        payload = array(typecode, items)
+        if sys.byteorder == "big":
+            payload.byteswap()
+        file.write(BINARY_HEADER.pack(BINARY_MAGIC, typecode.encode(), len(payload)))
+        file.write(payload.tobytes())
+
+    @classmethod
+    def load_binary(cls, file, indexed=False):
+        """Чтение списка, записанного dump_binary"""
+        magic, typecode, count = BINARY_HEADER.unpack(file.read(BINARY_HEADER.size))
+        if magic != BINARY_MAGIC:
+            raise ValueError("Not a DoublyLinkedList binary dump")
+
+        payload = array(typecode.decode())
+        payload.frombytes(file.read(count * payload.itemsize))
+        if len(payload) != count:
+            raise ValueError("Truncated DoublyLinkedList binary dump")
+        if sys.byteorder == "big":
+            payload.byteswap()
+
+        result = cls(indexed=indexed)
+        result.extend(payload.tolist())
+        return result
+
+    def cursor(self, index=0):
+        """Курсор, установленный на элемент с заданным индексом"""
+        return Cursor(self, index)
 
     def __iter__(self):
         """Итератор для списка"""
         current = self.head
-        while current:
+        while current is not None:
             yield current.data
             current = current.next
 
     def iterate_backward(self):
         """Итерация в обратном порядке"""
         current = self.tail
-        while current:
+        while current is not None:
             yield current.data
             current = current.prev
 
 
+class Cursor:
+    """Курсор по двунаправленному списку, запоминающий текущий узел
+
+    Позиция index == len(list) означает место за последним элементом.
+    Изменения списка в обход курсора делают курсор недействительным.
+    """
+
+    def __init__(self, dll, index=0):
+        if index < 0 or index > dll.length:
+            raise IndexError("Index out of range")
+
+        dll._normalize()
+        self._dll = dll
+        self._node = dll._get_node(index) if index < dll.length else None
+        self.index = index
+        self._version = dll._version
+
+    def __str__(self):
+        return f"Cursor({self.index})"
+
+    def _check(self):
+        """Проверка, что список не менялся в обход курсора"""
+        if self._dll._version != self._version:
+            raise RuntimeError("List was modified outside of the cursor")
+
+    def _current(self):
+        """Текущий узел (ошибка, если курсор за концом списка)"""
+        self._check()
+        if self._node is None:
+            raise IndexError("Cursor is at the end of the list")
+        return self._node
+
+    def at_end(self):
+        """Находится ли курсор за последним элементом"""
+        self._check()
+        return self._node is None
+
+    def get(self):
+        """Элемент под курсором"""
+        return self._current().data
+
+    def replace(self, data):
+        """Замена элемента под курсором"""
+        node = self._current()
+        dll = self._dll
+        if dll._intrusive:
+            # Узел интрузивного списка - сам объект, подменить его данные нельзя
+            raise TypeError("Cannot replace objects of an intrusive list")
+        if dll._index is not None:
+            dll._index_discard(node)
+        node.data = data
+        if dll._index is not None:
+            dll._index_add(node)
+
+    def move(self, k):
+        """Перемещение курсора на k позиций (k < 0 - назад)"""
+        self._check()
+        dll = self._dll
+        target = self.index + k
+        if target < 0 or target > dll.length:
+            raise IndexError("Index out of range")
+
+        node = self._node
+        for _ in range(k):
+            node = node.next
+        for _ in range(-k):
+            node = node.prev if node is not None else dll.tail
+
+        self._node = node
+        self.index = target
+
+    def _link(self, data, before):
+        """Вставка нового узла перед узлом before"""
+        dll = self._dll
+        dll._check_room(1)
+        dll._link_node(dll._node_type(data), before)
+        self._version = dll._version
+
+    def insert_before(self, data):
+        """Вставка элемента перед курсором (курсор остается на своем элементе)"""
+        self._check()
+        self._link(data, self._node)
+        self.index += 1
+
+    def insert_after(self, data):
+        """Вставка элемента после элемента под курсором"""
+        node = self._current()
+        self._link(data, node.next)
+
+    def remove_current(self):
+        """Удаление элемента под курсором, курсор переходит на следующий"""
+        node = self._current()
+        self._node = node.next
+        data = self._dll._unlink(node)
+        self._version = self._dll._version
+        return data
+
+
 # Демонстрация работы класса
 def demo_doubly_linked_list():
     """Демонстрация работы двунаправленного списка"""
@@ -273,6 +996,100 @@ def demo_doubly_linked_list():
     print(f"Пустой ли список: {dll.is_empty()}")
 
 
+def cursor_demo():
+    """Демонстрация правки списка через курсор"""
+
+    print("\n" + "=" * 60)
+    print("ПРАВКА СПИСКА ЧЕРЕЗ КУРСОР:")
+    print("=" * 60)
+
+    dll = DoublyLinkedList()
+    dll.from_list(range(1, 9))
+    print(f"Исходный список: {dll}")
+
+    # Удаляем четные числа и дублируем нечетные за один проход
+    cursor = dll.cursor()
+    while not cursor.at_end():
+        if cursor.get() % 2 == 0:
+            cursor.remove_current()
+        else:
+            cursor.insert_after(cursor.get() * 10)
+            cursor.move(2)
+    print(f"После одного прохода курсором: {dll}")
+
+    cursor = dll.cursor(1)
+    cursor.replace("X")
+    print(f"После замены элемента с индексом 1: {dll}")
+
+
+def sorting_demo():
+    """Демонстрация сортировки и вставки в отсортированный список"""
+
+    print("\n" + "=" * 60)
+    print("СОРТИРОВКА БЕЗ ПРЕОБРАЗОВАНИЯ В СПИСОК PYTHON:")
+    print("=" * 60)
+
+    dll = DoublyLinkedList()
+    dll.from_list([42, 7, 19, 3, 25, 7])
+    dll.sort()
+    print(f"После sort(): {dll}")
+
+    dll.insort(20)
+    print(f"После insort(20): {dll}")
+
+    other = DoublyLinkedList()
+    other.from_list([1, 8, 50])
+    dll.merge(other)
+    print(f"После слияния с [1 <-> 8 <-> 50]: {dll}")
+
+    dll.sort(key=lambda x: x % 10, reverse=True)
+    print(f"По последней цифре, по убыванию: {dll}")
+
+
+def bulk_removal_demo():
+    """Демонстрация удаления элементов за один проход"""
+
+    print("\n" + "=" * 60)
+    print("МАССОВОЕ УДАЛЕНИЕ ЗА ОДИН ПРОХОД:")
+    print("=" * 60)
+
+    dll = DoublyLinkedList()
+    dll.from_list([5, 3, 8, 3, 1, 8, 9, 3, 2])
+    print(f"Исходный список: {dll}")
+
+    print(f"dedupe() удалил: {dll.dedupe()}, осталось: {dll}")
+    print(f"remove_if(четные) удалил: {dll.remove_if(lambda x: x % 2 == 0)}, осталось: {dll}")
+    print(f"remove_all(3) удалил элементов: {len(dll.remove_all(3))}, осталось: {dll}")
+    dll.retain_if(lambda x: x > 4)
+    print(f"После retain_if(x > 4): {dll}")
+
+
+def deque_demo():
+    """Демонстрация операций с концами списка и ограничения длины"""
+
+    print("\n" + "=" * 60)
+    print("ОПЕРАЦИИ С КОНЦАМИ И ОГРАНИЧЕНИЕ ДЛИНЫ:")
+    print("=" * 60)
+
+    dll = DoublyLinkedList(maxlen=4)
+    dll.from_list([1, 2, 3, 4, 5, 6])
+    print(f"from_list(1..6) при maxlen=4: {dll}")
+
+    dll.appendleft(0)
+    print(f"После appendleft(0) (вытеснен конец): {dll}")
+    dll.rotate(1)
+    print(f"После rotate(1): {dll}")
+    dll.rotate(-2)
+    print(f"После rotate(-2): {dll}")
+    print(f"pop(): {dll.pop()}, popleft(): {dll.popleft()}, осталось: {dll}")
+
+    queue = QueueUsingDLL()
+    for task in "ABCD":
+        queue.enqueue(task)
+    queue.rotate()  # Обход по кругу без создания новых узлов
+    print(f"Очередь после rotate(): {queue}, первый: {queue.front()}")
+
+
 def different_data_types_demo():
     """Демонстрация работы с разными типами данных"""
 
@@ -305,8 +1122,8 @@ def different_data_types_demo():
 class StackUsingDLL:
     """Стек на основе двунаправленного списка"""
 
-    def __init__(self):
-        self.dll = DoublyLinkedList()
+    def __init__(self, indexed=False):
+        self.dll = DoublyLinkedList(indexed=indexed)
 
     def push(self, data):
         """Добавление элемента в стек"""
@@ -316,13 +1133,17 @@ class StackUsingDLL:
         """Извлечение элемента из стека"""
         if self.dll.is_empty():
             raise IndexError("Stack is empty")
-        return self.dll.remove(len(self.dll) - 1)
+        return self.dll.pop()
 
     def peek(self):
         """Просмотр верхнего элемента без извлечения"""
         if self.dll.is_empty():
             raise IndexError("Stack is empty")
-        return self.dll.get(len(self.dll) - 1)
+        return self.dll.peek()
+
+    def contains(self, data):
+        """Проверка наличия элемента в стеке"""
+        return self.dll.contains(data)
 
     def is_empty(self):
         return self.dll.is_empty()
@@ -337,8 +1158,8 @@ class StackUsingDLL:
 class QueueUsingDLL:
     """Очередь на основе двунаправленного списка"""
 
-    def __init__(self):
-        self.dll = DoublyLinkedList()
+    def __init__(self, indexed=False):
+        self.dll = DoublyLinkedList(indexed=indexed)
 
     def enqueue(self, data):
         """Добавление элемента в очередь"""
@@ -348,13 +1169,25 @@ class QueueUsingDLL:
         """Извлечение элемента из очереди"""
         if self.dll.is_empty():
             raise IndexError("Queue is empty")
-        return self.dll.remove(0)
+        return self.dll.popleft()
 
     def front(self):
         """Просмотр первого элемента без извлечения"""
         if self.dll.is_empty():
             raise IndexError("Queue is empty")
-        return self.dll.get(0)
+        return self.dll.peekleft()
+
+    def contains(self, data):
+        """Проверка наличия элемента в очереди"""
+        return self.dll.contains(data)
+
+    def merge(self, other):
+        """Перенос всех элементов другой очереди в конец этой без копирования"""
+        self.dll.splice(other.dll, len(self.dll))
+
+    def rotate(self, k=1):
+        """Перенос k первых элементов в конец очереди (обход по кругу)"""
+        self.dll.rotate(-k)
 
     def is_empty(self):
         return self.dll.is_empty()
@@ -371,6 +1204,12 @@ if __name__ == "__main__":
 
     different_data_types_demo()
 
+    cursor_demo()
+
+    sorting_demo()
+    bulk_removal_demo()
+    deque_demo()
+
     print("\n" + "=" * 60)
     print("РЕАЛИЗАЦИЯ СТЕКА И ОЧЕРЕДИ НА ОСНОВЕ ДВУНАПРАВЛЕННОГО СПИСКА")
     print("=" * 60)
@@ -387,11 +1226,18 @@ if __name__ == "__main__":
     print(f"Стек после извлечения: {stack}")
 
     print("\nОчередь:")
-    queue = QueueUsingDLL()
+    queue = QueueUsingDLL(indexed=True)
     queue.enqueue("A")
     queue.enqueue("B")
     queue.enqueue("C")
     print(f"Очередь после добавления A, B, C: {queue}")
+    print(f"B уже в очереди: {queue.contains('B')}")
     print(f"Первый элемент: {queue.front()}")
     print(f"Извлекаем: {queue.dequeue()}")
-    print(f"Очередь после извлечения: {queue}")
\ No newline at end of file
+    print(f"Очередь после извлечения: {queue}")
+
+    other_queue = QueueUsingDLL()
+    other_queue.enqueue("D")
+    other_queue.enqueue("E")
+    queue.merge(other_queue)
+    print(f"Очередь после слияния с [D <-> E]: {queue}")
\ No newline at end of file
@@ -0,0 +1,262 @@
+"""
+Числовой двунаправленный список с векторными операциями
+Значения хранятся подряд в array, поэтому суммы и поиск идут по одному буферу
+"""
+import time
+from array import array
+
+from arena_list import NIL, ArrayDoublyLinkedList
+from main import DoublyLinkedList
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен, без него работают циклы модуля array
+    np = None
+
+
+class NumericDoublyLinkedList(ArrayDoublyLinkedList):
+    """Двунаправленный список чисел одного типа на массивах
+
+    Значения занимают ячейки 0..length-1 без дыр: при удалении на место
+    освободившейся ячейки переносится последняя. Порядок ячеек совпадает
+    с порядком списка, пока элементы только добавляются в конец.
+    """
+
+    def __init__(self, typecode="d", capacity=16):
+        super().__init__(capacity)
+        self.typecode = typecode
+        self._data = array(typecode)
+        self._ordered = True  # Ячейка i хранит i-й элемент списка
+
+    def _grow(self):
+        """Увеличение емкости массивов связей в два раза"""
+        extra = self._capacity
+        self._next.extend(array('i', [NIL]) * extra)
+        self._prev.extend(array('i', [NIL]) * extra)
+        self._capacity += extra
+
+    def _alloc(self, data):
+        """Выделение ячейки сразу за последней занятой"""
+        slot = self.length
+        if slot == self._capacity:
+            self._grow()
+
+        self._data.append(data)
+        self._next[slot] = NIL
+        self._prev[slot] = NIL
+        return slot
+
+    def _release(self, slot):
+        """Освобождение ячейки с переносом в нее последней ячейки"""
+        data = self._data[slot]
+        last = self.length  # Длина уже уменьшена - это номер последней ячейки
+
+        if slot != last:
+            self._data[slot] = self._data[last]
+            after = self._next[last]
+            before = self._prev[last]
+            self._next[slot] = after
+            self._prev[slot] = before
+
+            if before == NIL:
+                self.head = slot
+            else:
+                self._next[before] = slot
+
+            if after == NIL:
+                self.tail = slot
+            else:
+                self._prev[after] = slot
+
+            self._ordered = False
+
+        self._data.pop()
+        return data
+
+    def remove(self, index):
+        """Удаление элемента по индексу
+
+        Пока жив buffer() или массив NumPy над данными, массив нельзя
+        укоротить. Это проверяется до изменения связей, чтобы BufferError
+        не оставил список и значения рассогласованными.
+        """
+        if self._data:
+            self._data.append(self._data.pop())  # BufferError, если буфер экспортирован
+        return super().remove(index)
+
+    def prepend(self, data):
+        """Добавление элемента в начало списка"""
+        super().prepend(data)
+        if self.length > 1:
+            self._ordered = False
+
+    def insert(self, index, data):
+        """Вставка элемента в произвольную позицию"""
+        super().insert(index, data)
+        if index < self.length - 1:
+            self._ordered = False
+
+    def reverse(self):
+        """Разворот списка за O(1)"""
+        super().reverse()
+        if self.length > 1:
+            self._ordered = False
+
+    def clear(self):
+        """Очистка списка"""
+        self.__init__(self.typecode)
+
+    def from_list(self, data_list):
+        """Создание списка из последовательности чисел за один проход"""
+        values = array(self.typecode, data_list)
+        count = len(values)
+        self.__init__(self.typecode, count)
+        if count == 0:
+            return
+
+        self._data = values
+        self._next = array('i', range(1, count + 1))
+        self._next[-1] = NIL
+        self._prev = array('i', range(-1, count - 1))
+        self.head = 0
+        self.tail = count - 1
+        self.length = count
+
+    def compact(self):
+        """Перекладка значений в порядке списка (ячейка i - i-й элемент)"""
+        if not self._ordered:
+            self.from_list(array(self.typecode, self))
+
+    def _numpy(self):
+        """Представление значений как массива NumPy без копирования"""
+        return np.frombuffer(self._data, dtype=self.typecode)
+
+    def sum(self):
+        """Сумма всех элементов
+
+        Целые шире 32 бит NumPy складывает в int64 с молча переполняемым
+        результатом, поэтому они суммируются точно средствами Python.
+        """
+        if np is not None and (self.typecode in "fd" or self._data.itemsize <= 4):
+            return self._numpy().sum().item()
+        return sum(self._data)
+
+    def min(self):
+        """Минимальный элемент"""
+        if not self._data:
+            raise ValueError("min() of empty list")
+        if np is not None:
+            return self._numpy().min().item()
+        return min(self._data)
+
+    def max(self):
+        """Максимальный элемент"""
+        if not self._data:
+            raise ValueError("max() of empty list")
+        if np is not None:
+            return self._numpy().max().item()
+        return max(self._data)
+
+    def count(self, value):
+        """Количество вхождений значения"""
+        if np is not None:
+            return int(np.count_nonzero(self._numpy() == value))
+        return self._data.count(value)
+
+    def find(self, value):
+        """Индекс первого вхождения значения (-1, если его нет)"""
+        if self._ordered:
+            try:
+                return self._data.index(value)
+            except ValueError:
+                return -1
+
+        # Ячейки со значением находятся по буферу, позиция - проходом по связям
+        if np is not None:
+            slots = set(np.flatnonzero(self._numpy() == value).tolist())
+        else:
+            slots = set()
+            start = 0
+            while True:
+                try:
+                    start = self._data.index(value, start)
+                except ValueError:
+                    break
+                slots.add(start)
+                start += 1
+
+        if not slots:
+            return -1
+
+        current = self.head
+        index = 0
+        while current not in slots:
+            current = self._next[current]
+            index += 1
+        return index
+
+    def index_of(self, data):
+        """Поиск индекса элемента (первого вхождения)"""
+        return self.find(data)
+
+    def contains(self, data):
+        """Проверка наличия элемента в списке"""
+        return data in self._data
+
+    def buffer(self):
+        """Значения в порядке списка как memoryview без копирования
+
+        Пока memoryview не освобожден, менять список нельзя (BufferError).
+        """
+        self.compact()
+        return memoryview(self._data)
+
+    def __array__(self, dtype=None, copy=None):
+        """Поддержка numpy.asarray без копирования данных"""
+        result = np.frombuffer(self.buffer(), dtype=self.typecode)
+        if dtype is not None:
+            result = result.astype(dtype, copy=False)
+        return result
+
+
+def benchmark_reductions(size=1_000_000):
+    """Сравнение поиска и суммирования с обычным DoublyLinkedList"""
+    print("\n" + "=" * 60)
+    print(f"СУММА И ПОИСК ПО {size} ЧИСЛАМ (NumPy: {'есть' if np else 'нет'})")
+    print("=" * 60)
+
+    plain = DoublyLinkedList()
+    plain.from_list(range(size))
+    numeric = NumericDoublyLinkedList("q")
+    numeric.from_list(range(size))
+
+    for name, action in (("DoublyLinkedList sum", lambda: sum(plain)),
+                         ("NumericDoublyLinkedList sum", numeric.sum),
+                         ("DoublyLinkedList index_of", lambda: plain.index_of(size - 1)),
+                         ("NumericDoublyLinkedList find", lambda: numeric.find(size - 1))):
+        start = time.perf_counter()
+        result = action()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>30}: {elapsed * 1e3:8.2f} мс (результат {result})")
+
+
+def demo_numeric_list():
+    """Демонстрация числового списка"""
+    print("=== ЧИСЛОВОЙ СПИСОК НА МАССИВАХ ===")
+
+    dll = NumericDoublyLinkedList("d")
+    dll.from_list([3.5, 1.0, 4.0, 1.0, 5.5])
+    dll.prepend(9.0)
+    print(f"Список: {dll}")
+    print(f"Сумма: {dll.sum()}, минимум: {dll.min()}, максимум: {dll.max()}")
+    print(f"Количество 1.0: {dll.count(1.0)}, индекс 4.0: {dll.find(4.0)}")
+    print(f"Удаляем элемент с индексом 2: {dll.remove(2)}")
+
+    view = dll.buffer()
+    print(f"memoryview без копирования: {view.tolist()}")
+    view.release()
+
+
+if __name__ == "__main__":
+    demo_numeric_list()
+    benchmark_reductions()
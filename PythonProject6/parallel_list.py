@@ -0,0 +1,157 @@
+"""
+Параллельные map, filter и reduce по содержимому двунаправленного списка
+Цепочка режется на отрезки подряд идущих элементов, отрезки обрабатывают
+процессы ProcessPoolExecutor, результаты собираются в исходном порядке
+"""
+import functools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from main import DoublyLinkedList
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def _chunks(dll, chunk_size):
+    """Данные списка отрезками по chunk_size элементов"""
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+
+    chunk = []
+    for item in dll:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _map_chunk(fn, chunk):
+    return [fn(item) for item in chunk]
+
+
+def _filter_chunk(predicate, chunk):
+    return [bool(predicate(item)) for item in chunk]
+
+
+def _reduce_chunk(fn, chunk):
+    return functools.reduce(fn, chunk)
+
+
+def _run(worker, fn, chunks, workers):
+    """Обработка отрезков в процессах (результаты - в порядке отрезков)"""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return map(worker, repeat(fn), chunks)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(worker, repeat(fn), chunks))
+
+
+def _new_list(dll):
+    """Пустой список того же типа для результата"""
+    return type(dll)(indexed=dll._index is not None)
+
+
+def parallel_map(dll, fn, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """Новый список из fn(x) для каждого элемента
+
+    fn и данные должны передаваться между процессами через pickle,
+    поэтому fn - функция уровня модуля, а не lambda. workers=None -
+    по числу ядер, workers=1 - без запуска процессов.
+    """
+    result = _new_list(dll)
+    for chunk in _run(_map_chunk, fn, _chunks(dll, chunk_size), workers):
+        result.extend(chunk)
+    return result
+
+
+def parallel_filter(dll, predicate, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """Новый список из элементов, для которых predicate истинно
+
+    Процессы возвращают только флаги, поэтому в результат попадают
+    исходные объекты, а не их копии.
+    """
+    chunks = list(_chunks(dll, chunk_size))
+    result = _new_list(dll)
+    for chunk, mask in zip(chunks, _run(_filter_chunk, predicate, chunks, workers)):
+        result.extend(item for item, keep in zip(chunk, mask) if keep)
+    return result
+
+
+def parallel_reduce(dll, fn, init, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """Свертка fn(fn(init, x0), x1)... по отрезкам списка
+
+    Каждый отрезок сворачивается отдельно, затем частичные результаты
+    сворачиваются начиная с init, поэтому fn должна быть ассоциативной.
+    """
+    partials = _run(_reduce_chunk, fn, _chunks(dll, chunk_size), workers)
+    return functools.reduce(fn, partials, init)
+
+
+def _collatz_steps(n):
+    """Тяжелая для процессора функция для измерений"""
+    steps = 0
+    for start in range(n, n + 10):
+        value = start
+        while value != 1:
+            value = value // 2 if value % 2 == 0 else 3 * value + 1
+            steps += 1
+    return steps
+
+
+def _is_long(steps):
+    return steps > 500
+
+
+def _add(a, b):
+    return a + b
+
+
+def benchmark_scaling(size=20_000, chunk_size=500, worker_counts=(1, 2, 4, 8)):
+    """Ускорение parallel_map/filter/reduce в зависимости от числа процессов"""
+    print("\n" + "=" * 60)
+    print(f"ПАРАЛЛЕЛЬНАЯ ОБРАБОТКА: {size} ЭЛЕМЕНТОВ, ОТРЕЗКИ ПО {chunk_size}, "
+          f"ЯДЕР: {os.cpu_count()}")
+    print("=" * 60)
+
+    dll = DoublyLinkedList()
+    dll.from_list(range(1, size + 1))
+
+    start = time.perf_counter()
+    expected = [_collatz_steps(item) for item in dll]
+    baseline = time.perf_counter() - start
+    print(f"{'обычный обход':>14}: {baseline:.2f} с")
+
+    for workers in worker_counts:
+        start = time.perf_counter()
+        steps = parallel_map(dll, _collatz_steps, chunk_size, workers)
+        map_time = time.perf_counter() - start
+        assert steps.to_list() == expected
+
+        start = time.perf_counter()
+        long_runs = parallel_filter(steps, _is_long, chunk_size, workers)
+        total = parallel_reduce(steps, _add, 0, chunk_size, workers)
+        rest_time = time.perf_counter() - start
+
+        print(f"{workers:>5} процессов: map {map_time:.2f} с (ускорение {baseline / map_time:.1f}x), "
+              f"filter+reduce {rest_time:.2f} с, длинных {len(long_runs)}, сумма {total}")
+
+
+def demo_parallel():
+    """Демонстрация параллельных операций"""
+    print("=== ПАРАЛЛЕЛЬНЫЕ MAP, FILTER, REDUCE ===")
+
+    dll = DoublyLinkedList()
+    dll.from_list(range(100, 1100, 100))
+    steps = parallel_map(dll, _collatz_steps, chunk_size=3, workers=2)
+    print(f"Шаги Коллатца: {steps}")
+    print(f"Больше 500 шагов: {parallel_filter(steps, _is_long, chunk_size=3, workers=2)}")
+    print(f"Сумма: {parallel_reduce(steps, _add, 0, chunk_size=3, workers=2)}")
+
+
+if __name__ == "__main__":
+    demo_parallel()
+    benchmark_scaling()
@@ -0,0 +1,308 @@
+"""
+Стек и очередь на основе растущего кольцевого буфера
+Элементы лежат в одном списке Python, узлы на каждый элемент не создаются
+"""
+import time
+from collections import deque
+
+from main import QueueUsingDLL, StackUsingDLL
+
+
+class RingBuffer:
+    """Кольцевой буфер, емкость которого удваивается при заполнении"""
+
+    def __init__(self, capacity=16):
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._items = [None] * size
+        self._mask = size - 1  # Емкость - степень двойки, индекс берется по маске
+        self._head = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """Обход от начала к концу"""
+        items = self._items
+        mask = self._mask
+        for i in range(self._head, self._head + self._size):
+            yield items[i & mask]
+
+    def __str__(self):
+        return "[" + " <-> ".join(str(item) for item in self) + "]"
+
+    def _grow(self, needed):
+        """Увеличение емкости с переносом элементов в начало массива"""
+        size = len(self._items)
+        while size < needed:
+            size <<= 1
+        items = self.to_list()
+        items.extend([None] * (size - len(items)))
+        self._items = items
+        self._mask = size - 1
+        self._head = 0
+
+    def to_list(self):
+        """Элементы от начала к концу в виде списка Python"""
+        start = self._head
+        stop = start + self._size
+        capacity = len(self._items)
+        if stop <= capacity:
+            return self._items[start:stop]
+        return self._items[start:] + self._items[:stop - capacity]
+
+    def append(self, data):
+        """Добавление элемента в конец"""
+        if self._size == len(self._items):
+            self._grow(self._size + 1)
+        self._items[(self._head + self._size) & self._mask] = data
+        self._size += 1
+
+    def extend(self, iterable):
+        """Добавление нескольких элементов в конец копированием срезов"""
+        batch = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+        count = len(batch)
+        if self._size + count > len(self._items):
+            self._grow(self._size + count)
+
+        capacity = len(self._items)
+        start = (self._head + self._size) & self._mask
+        first = min(count, capacity - start)
+        self._items[start:start + first] = batch[:first]
+        self._items[:count - first] = batch[first:]
+        self._size += count
+
+    def pop(self):
+        """Извлечение элемента с конца"""
+        self._size -= 1
+        index = (self._head + self._size) & self._mask
+        data = self._items[index]
+        self._items[index] = None
+        return data
+
+    def popleft(self):
+        """Извлечение элемента из начала"""
+        index = self._head
+        data = self._items[index]
+        self._items[index] = None
+        self._head = (index + 1) & self._mask
+        self._size -= 1
+        return data
+
+    def peek(self):
+        """Последний элемент"""
+        return self._items[(self._head + self._size - 1) & self._mask]
+
+    def peekleft(self):
+        """Первый элемент"""
+        return self._items[self._head]
+
+    def _take(self, start, count):
+        """Вырезание count элементов начиная с логической позиции start"""
+        capacity = len(self._items)
+        begin = (self._head + start) & self._mask
+        first = min(count, capacity - begin)
+        rest = count - first
+
+        result = self._items[begin:begin + first]
+        self._items[begin:begin + first] = [None] * first
+        if rest:
+            result += self._items[:rest]
+            self._items[:rest] = [None] * rest
+        return result
+
+    def pop_many(self, k):
+        """Извлечение до k элементов с конца (последний - первым)"""
+        if k < 0:
+            raise ValueError("Count must be non-negative")
+        count = min(k, self._size)
+        result = self._take(self._size - count, count)
+        self._size -= count
+        result.reverse()
+        return result
+
+    def popleft_many(self, k):
+        """Извлечение до k элементов из начала"""
+        if k < 0:
+            raise ValueError("Count must be non-negative")
+        count = min(k, self._size)
+        result = self._take(0, count)
+        self._head = (self._head + count) & self._mask
+        self._size -= count
+        return result
+
+    def clear(self):
+        """Очистка буфера"""
+        self.__init__(len(self._items))
+
+
+class StackUsingRing:
+    """Стек на основе кольцевого буфера"""
+
+    def __init__(self):
+        self.buffer = RingBuffer()
+
+    def push(self, data):
+        """Добавление элемента в стек"""
+        self.buffer.append(data)
+
+    def push_many(self, items):
+        """Добавление нескольких элементов в стек"""
+        self.buffer.extend(items)
+
+    def pop(self):
+        """Извлечение элемента из стека"""
+        if not self.buffer:
+            raise IndexError("Stack is empty")
+        return self.buffer.pop()
+
+    def pop_many(self, k):
+        """Извлечение до k элементов (верхний - первым)"""
+        return self.buffer.pop_many(k)
+
+    def drain(self):
+        """Извлечение всех элементов (верхний - первым)"""
+        return self.buffer.pop_many(len(self.buffer))
+
+    def peek(self):
+        """Просмотр верхнего элемента без извлечения"""
+        if not self.buffer:
+            raise IndexError("Stack is empty")
+        return self.buffer.peek()
+
+    def contains(self, data):
+        """Проверка наличия элемента в стеке"""
+        return data in self.buffer
+
+    def is_empty(self):
+        return len(self.buffer) == 0
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def __str__(self):
+        return str(self.buffer)
+
+
+class QueueUsingRing:
+    """Очередь на основе кольцевого буфера"""
+
+    def __init__(self):
+        self.buffer = RingBuffer()
+
+    def enqueue(self, data):
+        """Добавление элемента в очередь"""
+        self.buffer.append(data)
+
+    def enqueue_many(self, items):
+        """Добавление нескольких элементов в очередь"""
+        self.buffer.extend(items)
+
+    def dequeue(self):
+        """Извлечение элемента из очереди"""
+        if not self.buffer:
+            raise IndexError("Queue is empty")
+        return self.buffer.popleft()
+
+    def dequeue_many(self, k):
+        """Извлечение до k элементов в порядке очереди"""
+        return self.buffer.popleft_many(k)
+
+    def drain(self):
+        """Извлечение всех элементов в порядке очереди"""
+        return self.buffer.popleft_many(len(self.buffer))
+
+    def front(self):
+        """Просмотр первого элемента без извлечения"""
+        if not self.buffer:
+            raise IndexError("Queue is empty")
+        return self.buffer.peekleft()
+
+    def contains(self, data):
+        """Проверка наличия элемента в очереди"""
+        return data in self.buffer
+
+    def merge(self, other):
+        """Перенос всех элементов другой очереди в конец этой"""
+        self.buffer.extend(other.drain())
+
+    def is_empty(self):
+        return len(self.buffer) == 0
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def __str__(self):
+        return str(self.buffer)
+
+
+def benchmark_throughput(count=1_000_000, batch=1000):
+    """Пропускная способность очередей и стеков в элементах в секунду"""
+    print("\n" + "=" * 60)
+    print(f"ПРОПУСКНАЯ СПОСОБНОСТЬ: {count} ЭЛЕМЕНТОВ")
+    print("=" * 60)
+
+    def run(name, put, get):
+        start = time.perf_counter()
+        put()
+        get()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>34}: {count / elapsed / 1e6:6.2f} млн элементов/с")
+
+    items = list(range(count))
+
+    queue = QueueUsingDLL()
+    run("QueueUsingDLL", lambda: [queue.enqueue(x) for x in items],
+        lambda: [queue.dequeue() for _ in items])
+
+    queue = QueueUsingRing()
+    run("QueueUsingRing", lambda: [queue.enqueue(x) for x in items],
+        lambda: [queue.dequeue() for _ in items])
+
+    queue = QueueUsingRing()
+    run(f"QueueUsingRing (пакеты по {batch})",
+        lambda: [queue.enqueue_many(items[i:i + batch]) for i in range(0, count, batch)],
+        lambda: [queue.dequeue_many(batch) for _ in range(0, count, batch)])
+
+    queue = deque()
+    run("deque", lambda: [queue.append(x) for x in items],
+        lambda: [queue.popleft() for _ in items])
+
+    stack = StackUsingDLL()
+    run("StackUsingDLL", lambda: [stack.push(x) for x in items],
+        lambda: [stack.pop() for _ in items])
+
+    stack = StackUsingRing()
+    run("StackUsingRing", lambda: [stack.push(x) for x in items],
+        lambda: [stack.pop() for _ in items])
+
+    stack = StackUsingRing()
+    run(f"StackUsingRing (пакеты по {batch})",
+        lambda: [stack.push_many(items[i:i + batch]) for i in range(0, count, batch)],
+        lambda: [stack.pop_many(batch) for _ in range(0, count, batch)])
+
+
+def demo_ring_buffer():
+    """Демонстрация стека и очереди на кольцевом буфере"""
+    print("=== ОЧЕРЕДЬ НА КОЛЬЦЕВОМ БУФЕРЕ ===")
+    queue = QueueUsingRing()
+    queue.enqueue_many("ABCDE")
+    print(f"Очередь: {queue}")
+    print(f"Извлекаем два элемента: {queue.dequeue_many(2)}")
+    queue.enqueue("F")
+    print(f"Первый элемент: {queue.front()}, очередь: {queue}")
+    print(f"Извлекаем все: {queue.drain()}")
+
+    print("\n=== СТЕК НА КОЛЬЦЕВОМ БУФЕРЕ ===")
+    stack = StackUsingRing()
+    stack.push_many([1, 2, 3, 4])
+    print(f"Стек: {stack}, верхний элемент: {stack.peek()}")
+    print(f"Извлекаем три элемента: {stack.pop_many(3)}")
+    print(f"Стек после извлечения: {stack}")
+
+
+if __name__ == "__main__":
+    demo_ring_buffer()
+    benchmark_throughput()
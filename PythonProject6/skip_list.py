@@ -0,0 +1,279 @@
+"""
+Двунаправленный список с индексируемым списком с пропусками
+Экспресс-связи хранят ширину прыжка, поэтому поиск по индексу - O(log n)
+"""
+import random
+import time
+
+from main import DoublyLinkedList, Node
+
+MAX_LEVEL = 32  # Максимальное число экспресс-уровней
+PROMOTION = 0.25  # Вероятность подняться на следующий уровень
+
+
+def random_height():
+    """Случайная высота нового узла"""
+    height = 0
+    while height < MAX_LEVEL and random.random() < PROMOTION:
+        height += 1
+    return height
+
+
+class SkipNode(Node):
+    """Узел с экспресс-связями и их ширинами"""
+
+    def __init__(self, data, height=None):
+        super().__init__(data)
+        if height is None:
+            height = random_height()
+        self.links = [None] * height
+        self.widths = [0] * height
+
+
+class SkipDoublyLinkedList(DoublyLinkedList):
+    """Двунаправленный список с доступом по индексу за O(log n)
+
+    insert и remove поддерживают экспресс-уровни на месте. После любых других
+    структурных изменений (reverse, extend, splice, cut, правки курсором)
+    уровни перестраиваются за O(n) при следующем обращении по индексу.
+    """
+
+    _node_type = SkipNode
+
+    def __init__(self, indexed=False, maxlen=None):
+        super().__init__(indexed=indexed, maxlen=maxlen)
+        self._header = SkipNode(None, MAX_LEVEL)
+        self._level = 0  # Число используемых экспресс-уровней
+        self._levels_version = self._version  # Версия списка, для которой построены уровни
+
+    def _sync(self):
+        """Перестройка уровней, если цепочку меняли в обход них"""
+        if self._levels_version != self._version:
+            self._rebuild()
+
+    def _raise_level(self, height):
+        """Добавление пустых экспресс-уровней до заданной высоты"""
+        header = self._header
+        for level in range(self._level, height):
+            header.links[level] = None
+            header.widths[level] = self.length + 1
+        self._level = height
+
+    def _search(self, index):
+        """Последние узлы перед позицией index на каждом уровне"""
+        update = [None] * self._level
+        steps = [0] * self._level
+        node = self._header
+        pos = -1
+
+        for level in reversed(range(self._level)):
+            while node.links[level] is not None and pos + node.widths[level] < index:
+                pos += node.widths[level]
+                node = node.links[level]
+            update[level] = node
+            steps[level] = pos
+
+        return update, steps, node, pos
+
+    def _walk(self, node, pos, index):
+        """Проход по основной цепочке от узла на позиции pos до index"""
+        if node is self._header:
+            node = None
+        current = node.next if node is not None else self.head
+        for _ in range(index - pos - 1):
+            current = current.next
+        return current
+
+    def _get_node(self, index):
+        """Получение узла по индексу через экспресс-связи"""
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of range")
+
+        self._sync()
+        node = self._header
+        pos = -1
+        for level in reversed(range(self._level)):
+            while node.links[level] is not None and pos + node.widths[level] <= index:
+                pos += node.widths[level]
+                node = node.links[level]
+
+        if pos == index:
+            return node
+        return self._walk(node, pos, index)
+
+    def append(self, data):
+        """Добавление элемента в конец списка"""
+        self.insert(self.length, data)
+
+    def prepend(self, data):
+        """Добавление элемента в начало списка"""
+        self.insert(0, data)
+
+    def insert(self, index, data):
+        """Вставка элемента в произвольную позицию"""
+        if index < 0 or index > self.length:
+            raise IndexError("Index out of range")
+        if 0 < index < self.length:
+            self._check_room(1)
+
+        self._sync()
+        height = random_height()
+        if height > self._level:
+            self._raise_level(height)
+
+        update, steps, node, pos = self._search(index)
+        after = self._walk(node, pos, index) if index < self.length else None
+        before = after.prev if after is not None else self.tail
+
+        new_node = SkipNode(data, height)
+        new_node.prev = before
+        new_node.next = after
+        if before is None:
+            self.head = new_node
+        else:
+            before.next = new_node
+        if after is None:
+            self.tail = new_node
+        else:
+            after.prev = new_node
+
+        for level in range(self._level):
+            pred = update[level]
+            if level < height:
+                new_node.links[level] = pred.links[level]
+                new_node.widths[level] = steps[level] + pred.widths[level] + 1 - index
+                pred.links[level] = new_node
+                pred.widths[level] = index - steps[level]
+            else:
+                pred.widths[level] += 1
+
+        self.length += 1
+        self._version += 1
+        self._levels_version = self._version
+        if self._index is not None:
+            self._index_add(new_node)
+        if self.maxlen is not None:
+            self._bound(index != 0)
+
+    def _bound(self, from_head):
+        """Вытеснение элементов сверх maxlen с поддержкой экспресс-уровней"""
+        while self.length > self.maxlen:
+            self.remove(0 if from_head else self.length - 1)
+
+    def pop(self):
+        """Извлечение последнего элемента с поддержкой экспресс-уровней"""
+        if self.tail is None:
+            raise IndexError("List is empty")
+        return self.remove(self.length - 1)
+
+    def popleft(self):
+        """Извлечение первого элемента с поддержкой экспресс-уровней"""
+        if self.head is None:
+            raise IndexError("List is empty")
+        return self.remove(0)
+
+    def remove(self, index):
+        """Удаление элемента по индексу"""
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of range")
+
+        self._sync()
+        update, steps, node, pos = self._search(index)
+        node_to_remove = self._walk(node, pos, index)
+
+        for level in range(self._level):
+            pred = update[level]
+            if pred.links[level] is node_to_remove:
+                pred.widths[level] += node_to_remove.widths[level] - 1
+                pred.links[level] = node_to_remove.links[level]
+            else:
+                pred.widths[level] -= 1
+
+        data = self._unlink(node_to_remove)
+        self._levels_version = self._version
+        return data
+
+    def remove_value(self, data):
+        """Удаление первого вхождения элемента по значению"""
+        index = self.index_of(data)
+        if index == -1:
+            return False
+        self.remove(index)
+        return True
+
+    def _rebuild(self):
+        """Перестройка экспресс-уровней по основной цепочке за O(n)"""
+        header = self._header
+        last = [header] * MAX_LEVEL
+        last_pos = [-1] * MAX_LEVEL
+        top = 0
+
+        current = self.head
+        pos = 0
+        while current:
+            # Узлы, пришедшие из обычного списка, не имеют экспресс-связей
+            height = len(getattr(current, 'links', ()))
+            for level in range(height):
+                last[level].links[level] = current
+                last[level].widths[level] = pos - last_pos[level]
+                last[level] = current
+                last_pos[level] = pos
+            top = max(top, height)
+            current = current.next
+            pos += 1
+
+        for level in range(top):
+            last[level].links[level] = None
+            last[level].widths[level] = self.length - last_pos[level]
+        self._level = top
+        self._levels_version = self._version
+
+
+def benchmark_positional_access(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6), operations=200):
+    """Сравнение get/insert/remove со сканированием в DoublyLinkedList"""
+    print("\n" + "=" * 60)
+    print(f"ДОСТУП ПО ИНДЕКСУ: {operations} ОПЕРАЦИЙ КАЖДОГО ВИДА")
+    print("=" * 60)
+
+    for size in sizes:
+        indexes = [random.randrange(size) for _ in range(operations)]
+        for name, factory in (("DoublyLinkedList", DoublyLinkedList),
+                              ("SkipDoublyLinkedList", SkipDoublyLinkedList)):
+            container = factory()
+            container.from_list(range(size))
+            container.get(0)  # Экспресс-уровни строятся при первом обращении
+
+            start = time.perf_counter()
+            for index in indexes:
+                container.get(index)
+            get_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for index in indexes:
+                container.insert(index, index)
+                container.remove(index)
+            edit_time = time.perf_counter() - start
+
+            print(f"n={size:>8} {name:>20}: get {get_time * 1e6 / operations:9.1f} мкс, "
+                  f"insert+remove {edit_time * 1e6 / operations:9.1f} мкс")
+
+
+def demo_skip_list():
+    """Демонстрация работы списка с экспресс-связями"""
+    print("=== СПИСОК С ИНДЕКСИРУЕМЫМИ ЭКСПРЕСС-СВЯЗЯМИ ===")
+
+    dll = SkipDoublyLinkedList()
+    dll.from_list(range(0, 100, 10))
+    dll.prepend(-5)
+    dll.insert(3, 15)
+    print(f"Список: {dll}")
+    print(f"Элемент с индексом 7: {dll.get(7)}")
+    print(f"Удаляем элемент с индексом 3: {dll.remove(3)}")
+    dll.reverse()
+    print(f"Список после разворота: {dll}")
+    print(f"Элемент с индексом 0: {dll.get(0)}")
+
+
+if __name__ == "__main__":
+    demo_skip_list()
+    benchmark_positional_access()
@@ -0,0 +1,374 @@
+"""
+Развернутый (блочный) двунаправленный список
+Каждый узел хранит небольшой массив элементов фиксированной емкости
+"""
+import random
+import time
+
+from main import DoublyLinkedList
+
+
+class Block:
+    """Узел развернутого списка - блок элементов
+
+    owned=False означает, что массив items может разделяться со снимком
+    и перед изменением его нужно скопировать.
+    """
+
+    __slots__ = ('items', 'next', 'prev', 'owned')
+
+    def __init__(self, items=None, owned=True):
+        self.items = items if items is not None else []
+        self.next = None
+        self.prev = None
+        self.owned = owned
+
+    def __str__(self):
+        return str(self.items)
+
+
+class UnrolledView:
+    """Развернутый список только для чтения (в том числе снимок)"""
+
+    def __init__(self, block_size=64, head=None, tail=None, length=0):
+        self.block_size = block_size
+        self.head = head
+        self.tail = tail
+        self.length = length
+
+    def __str__(self):
+        """Строковое представление списка"""
+        return "[" + " <-> ".join(str(item) for item in self) + "]"
+
+    def __len__(self):
+        """Возвращает длину списка"""
+        return self.length
+
+    def is_empty(self):
+        """Проверка на пустоту списка"""
+        return self.head is None
+
+    def _get_node(self, index):
+        """Поиск блока и смещения в нем по индексу (вспомогательный метод)"""
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of range")
+
+        if index < self.length // 2:
+            block = self.head
+            while index >= len(block.items):
+                index -= len(block.items)
+                block = block.next
+        else:
+            index = self.length - 1 - index
+            block = self.tail
+            while index >= len(block.items):
+                index -= len(block.items)
+                block = block.prev
+            index = len(block.items) - 1 - index
+
+        return block, index
+
+    def get(self, index):
+        """Получение элемента по индексу"""
+        block, offset = self._get_node(index)
+        return block.items[offset]
+
+    def index_of(self, data):
+        """Поиск индекса элемента (первого вхождения)"""
+        base = 0
+        block = self.head
+        while block:
+            if data in block.items:
+                return base + block.items.index(data)
+            base += len(block.items)
+            block = block.next
+        return -1
+
+    def contains(self, data):
+        """Проверка наличия элемента в списке"""
+        return self.index_of(data) != -1
+
+    def to_list(self):
+        """Преобразование в обычный список Python"""
+        result = []
+        block = self.head
+        while block:
+            result.extend(block.items)
+            block = block.next
+        return result
+
+    def blocks(self):
+        """Количество блоков в списке"""
+        count = 0
+        block = self.head
+        while block:
+            count += 1
+            block = block.next
+        return count
+
+    def __iter__(self):
+        """Итератор для списка"""
+        block = self.head
+        while block:
+            yield from block.items
+            block = block.next
+
+    def iterate_backward(self):
+        """Итерация в обратном порядке"""
+        block = self.tail
+        while block:
+            yield from reversed(block.items)
+            block = block.prev
+
+
+class UnrolledLinkedList(UnrolledView):
+    """Развернутый двунаправленный список
+
+    snapshot() за O(1) отдает текущую цепочку блоков снимку. Первое изменение
+    после этого копирует только оболочки блоков (O(n / B)), а массивы
+    элементов копируются по одному при первом изменении каждого блока.
+    """
+
+    def __init__(self, block_size=64):
+        if block_size < 2:
+            raise ValueError("Block size must be at least 2")
+        super().__init__(block_size)
+        self._shared = False  # Цепочка блоков принадлежит снимку
+
+    def snapshot(self):
+        """Неизменяемый снимок текущего состояния за O(1)"""
+        self._shared = True
+        return UnrolledView(self.block_size, self.head, self.tail, self.length)
+
+    def _unshare(self):
+        """Копирование оболочек блоков, если цепочку забрал снимок"""
+        if not self._shared:
+            return
+
+        source = self.head
+        self.head = None
+        self.tail = None
+        while source:
+            self._link_after(self.tail, Block(source.items, owned=False))
+            source = source.next
+        self._shared = False
+
+    @staticmethod
+    def _own(block):
+        """Копирование массива элементов блока перед его изменением"""
+        if not block.owned:
+            block.items = list(block.items)
+            block.owned = True
+        return block.items
+
+    def _link_after(self, block, new_block):
+        """Вставка блока после заданного (None - в начало)"""
+        if block is None:
+            new_block.next = self.head
+            if self.head:
+                self.head.prev = new_block
+            self.head = new_block
+        else:
+            new_block.prev = block
+            new_block.next = block.next
+            if block.next:
+                block.next.prev = new_block
+            block.next = new_block
+
+        if new_block.next is None:
+            self.tail = new_block
+
+    def _unlink(self, block):
+        """Исключение блока из цепочки"""
+        if block.prev:
+            block.prev.next = block.next
+        else:
+            self.head = block.next
+
+        if block.next:
+            block.next.prev = block.prev
+        else:
+            self.tail = block.prev
+
+    def _split(self, block):
+        """Разделение переполненного блока пополам"""
+        half = len(block.items) // 2
+        new_block = Block(block.items[half:])
+        del self._own(block)[half:]
+        self._link_after(block, new_block)
+
+    def _rebalance(self, block):
+        """Слияние недозаполненного блока с соседом"""
+        if not block.items:
+            self._unlink(block)
+            return
+
+        if len(block.items) >= self.block_size // 2:
+            return
+
+        neighbour = block.next
+        if neighbour and len(block.items) + len(neighbour.items) <= self.block_size:
+            self._own(block).extend(neighbour.items)
+            self._unlink(neighbour)
+            return
+
+        neighbour = block.prev
+        if neighbour and len(block.items) + len(neighbour.items) <= self.block_size:
+            self._own(neighbour).extend(block.items)
+            self._unlink(block)
+
+    def append(self, data):
+        """Добавление элемента в конец списка"""
+        self._unshare()
+        if self.tail is None or len(self.tail.items) >= self.block_size:
+            self._link_after(self.tail, Block())
+        self._own(self.tail).append(data)
+        self.length += 1
+
+    def prepend(self, data):
+        """Добавление элемента в начало списка"""
+        self._unshare()
+        if self.head is None or len(self.head.items) >= self.block_size:
+            self._link_after(None, Block())
+        self._own(self.head).insert(0, data)
+        self.length += 1
+
+    def insert(self, index, data):
+        """Вставка элемента в произвольную позицию"""
+        if index < 0 or index > self.length:
+            raise IndexError("Index out of range")
+
+        if index == self.length:
+            self.append(data)
+            return
+
+        self._unshare()
+        block, offset = self._get_node(index)
+        self._own(block).insert(offset, data)
+        self.length += 1
+
+        if len(block.items) > self.block_size:
+            self._split(block)
+
+    def remove(self, index):
+        """Удаление элемента по индексу"""
+        self._unshare()
+        block, offset = self._get_node(index)
+        data = self._own(block).pop(offset)
+        self.length -= 1
+        self._rebalance(block)
+        return data
+
+    def clear(self):
+        """Очистка списка"""
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self._shared = False
+
+    def reverse(self):
+        """Разворот списка: меняется порядок блоков и элементов в них"""
+        self._unshare()
+        block = self.head
+        while block:
+            self._own(block).reverse()
+            block.next, block.prev = block.prev, block.next
+            block = block.prev
+
+        self.head, self.tail = self.tail, self.head
+
+    def from_list(self, data_list):
+        """Создание списка из обычного списка Python"""
+        items = list(data_list)
+        self.clear()
+        for start in range(0, len(items), self.block_size):
+            self._link_after(self.tail, Block(items[start:start + self.block_size]))
+        self.length = len(items)
+
+
+def benchmark_random_access(size=100_000, operations=2_000):
+    """Сравнение случайного доступа с обычным DoublyLinkedList"""
+    print("\n" + "=" * 60)
+    print(f"СЛУЧАЙНЫЙ ДОСТУП: {size} ЭЛЕМЕНТОВ, {operations} ОПЕРАЦИЙ")
+    print("=" * 60)
+
+    indexes = [random.randrange(size) for _ in range(operations)]
+
+    for name, container in (("DoublyLinkedList", DoublyLinkedList()),
+                            ("UnrolledLinkedList", UnrolledLinkedList())):
+        container.from_list(range(size))
+
+        start = time.perf_counter()
+        for index in indexes:
+            container.get(index)
+        get_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for index in indexes:
+            container.insert(index, index)
+            container.remove(index)
+        edit_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in container:
+            pass
+        iter_time = time.perf_counter() - start
+
+        print(f"{name:>20}: get {get_time:.3f} с, insert+remove {edit_time:.3f} с, "
+              f"обход {iter_time:.3f} с")
+
+
+def demo_unrolled_list():
+    """Демонстрация работы развернутого списка"""
+    print("=== РАЗВЕРНУТЫЙ СПИСОК (БЛОКИ ПО 4 ЭЛЕМЕНТА) ===")
+
+    dll = UnrolledLinkedList(block_size=4)
+    dll.from_list(range(1, 11))
+    print(f"Список: {dll}, блоков: {dll.blocks()}")
+    dll.insert(2, 99)
+    dll.insert(2, 98)
+    print(f"После вставки 99 и 98 на позицию 2: {dll}, блоков: {dll.blocks()}")
+    for _ in range(5):
+        dll.remove(0)
+    print(f"После удаления пяти первых элементов: {dll}, блоков: {dll.blocks()}")
+    dll.reverse()
+    print(f"Список после разворота: {dll}")
+    print(f"Элемент с индексом 3: {dll.get(3)}")
+
+
+def demo_snapshot(size=1_000_000):
+    """Демонстрация снимков с копированием при записи"""
+    print("\n=== СНИМКИ С КОПИРОВАНИЕМ ПРИ ЗАПИСИ ===")
+
+    dll = UnrolledLinkedList()
+    dll.from_list(range(size))
+
+    start = time.perf_counter()
+    view = dll.snapshot()
+    snapshot_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dll.to_list()
+    copy_time = time.perf_counter() - start
+    print(f"snapshot(): {snapshot_time * 1e6:.1f} мкс, to_list(): {copy_time * 1e6:.1f} мкс")
+
+    dll.remove(0)
+    dll.insert(size // 2, -1)
+    copied = sum(1 for block in _blocks(dll) if block.owned)
+    print(f"После двух правок скопировано блоков: {copied} из {dll.blocks()}")
+    print(f"Снимок: первый элемент {view.get(0)}, элемент {size // 2} - {view.get(size // 2)}")
+    print(f"Список: первый элемент {dll.get(0)}, элемент {size // 2 - 1} - {dll.get(size // 2 - 1)}")
+
+
+def _blocks(dll):
+    """Обход блоков списка"""
+    block = dll.head
+    while block:
+        yield block
+        block = block.next
+
+
+if __name__ == "__main__":
+    demo_unrolled_list()
+    demo_snapshot()
+    benchmark_random_access()
@@ -1,5 +1,13 @@
+import heapq
 import random
+import time
 from collections import deque
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен, без него пакетные запросы идут циклом
+    np = None
 
 
 class TreeNode:
@@ -9,144 +17,341 @@ class TreeNode:
         self.value = value
         self.left = None
         self.right = None
+        self.height = 1  # Высота поддерева, нужна сбалансированному режиму
+        self.size = 1  # Число узлов поддерева, нужно для порядковых статистик
 
     def __str__(self):
         return str(self.value)
 
 
 class BinaryTree:
-    """Класс бинарного дерева"""
+    """Класс бинарного дерева
+
+    balanced=True включает режим АВЛ-дерева: после insert и delete
+    высоты поддеревьев соседей отличаются не больше чем на 1, поэтому
+    высота дерева остается O(log n) даже на отсортированных данных.
+    """
 
-    def __init__(self):
+    def __init__(self, balanced=False):
         self.root = None
+        self.balanced = balanced
+
+    @classmethod
+    def from_sorted(cls, seq, balanced=False):
+        """Идеально сбалансированное дерево из отсортированных данных за O(n)"""
+        values = list(seq)
+        if any(b < a for a, b in zip(values, islice(values, 1, None))):
+            raise ValueError("Sequence must be sorted")
+
+        tree = cls(balanced=balanced)
+        # Отрезок [lo, hi) значений и узел, к которому подвешивается его середина
+        stack = [(0, len(values), None, False)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            if lo >= hi:
+                continue
+
+            mid = (lo + hi) // 2
+            node = TreeNode(values[mid])
+            # Левая половина не меньше правой и больше ее не более чем на один
+            # узел, поэтому высота зависит только от размера отрезка
+            node.height = (hi - lo).bit_length()
+            node.size = hi - lo
+            if parent is None:
+                tree.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+
+            stack.append((mid + 1, hi, node, False))
+            stack.append((lo, mid, node, True))
+
+        return tree
+
+    def freeze(self):
+        """Неизменяемая копия дерева в массиве (раскладка Эйтцингера)"""
+        return FrozenTree(self.iter_inorder())
 
     def insert(self, value):
         """Вставка элемента в бинарное дерево"""
+        node = TreeNode(value)
         if self.root is None:
-            self.root = TreeNode(value)
+            self.root = node
+            return
+
+        # Спуск без рекурсии, путь от корня нужен для балансировки
+        path = []
+        current = self.root
+        while current:
+            current.size += 1
+            path.append(current)
+            current = current.left if value < current.value else current.right
+
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = node
         else:
-            self._insert_recursive(self.root, value)
+            parent.right = node
+
+        if self.balanced:
+            self._rebalance_path(path)
+
+    @staticmethod
+    def _height(node):
+        """Высота поддерева (0 для пустого)"""
+        return node.height if node else 0
+
+    @staticmethod
+    def _size(node):
+        """Число узлов поддерева (0 для пустого)"""
+        return node.size if node else 0
+
+    def _update(self, node):
+        """Пересчет высоты и размера узла по его потомкам"""
+        node.height = max(self._height(node.left), self._height(node.right)) + 1
+        node.size = self._size(node.left) + self._size(node.right) + 1
+
+    def _rotate_left(self, node):
+        """Левый поворот вокруг узла, возвращает новый корень поддерева"""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        """Правый поворот вокруг узла, возвращает новый корень поддерева"""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rebalance(self, node):
+        """Восстановление баланса узла поворотами"""
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
 
-    def _insert_recursive(self, node, value):
-        """Рекурсивная вставка элемента"""
-        if value < node.value:
-            if node.left is None:
-                node.left = TreeNode(value)
-            else:
-                self._insert_recursive(node.left, value)
+        return node
+
+    def _rebalance_path(self, path):
+        """Балансировка узлов пути снизу вверх до корня"""
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                self._replace_child(path[i - 1] if i else None, node, subtree)
+
+    def _replace_child(self, parent, old, new):
+        """Замена потомка old у parent (или корня) на new"""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
         else:
-            if node.right is None:
-                node.right = TreeNode(value)
-            else:
-                self._insert_recursive(node.right, value)
+            parent.right = new
 
     def delete(self, value):
         """Удаление элемента из дерева"""
-        self.root = self._delete_recursive(self.root, value)
+        path = []
+        node = self.root
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
 
-    def _delete_recursive(self, node, value):
-        """Рекурсивное удаление элемента"""
         if node is None:
-            return node
+            return
 
-        if value < node.value:
-            node.left = self._delete_recursive(node.left, value)
-        elif value > node.value:
-            node.right = self._delete_recursive(node.right, value)
-        else:
-            # Узел найден
-            # Узел с одним или без детей
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-
-            # Узел с двумя детьми
-            # Находим минимальный элемент в правом поддереве
-            min_node = self._find_min(node.right)
-            node.value = min_node.value
-            node.right = self._delete_recursive(node.right, min_node.value)
+        if node.left is not None and node.right is not None:
+            # Узел с двумя детьми: значение заменяется минимальным из
+            # правого поддерева, а удаляется узел этого минимума
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
 
-        return node
+        # Все узлы пути теряют по одному потомку
+        for ancestor in path:
+            ancestor.size -= 1
 
-    def _find_min(self, node):
-        """Нахождение минимального элемента в поддереве"""
-        current = node
-        while current.left is not None:
-            current = current.left
-        return current
+        # Узел с одним или без детей
+        child = node.left if node.left is not None else node.right
+        self._replace_child(path[-1] if path else None, node, child)
+
+        if self.balanced:
+            self._rebalance_path(path)
 
     def contains(self, value):
         """Проверка наличия элемента в дереве"""
-        return self._contains_recursive(self.root, value)
+        node = self.root
+        while node is not None:
+            if node.value == value:
+                return True
+            node = node.left if value < node.value else node.right
+        return False
+
+    def size(self):
+        """Количество ключей в дереве"""
+        return self._size(self.root)
+
+    def recount(self):
+        """Пересчет размеров и высот поддеревьев за O(n)
+
+        insert, delete и from_sorted поддерживают их сами; после ручной
+        сборки дерева из TreeNode (как в заданиях 3 и 6) recount нужен
+        перед size, rank, select, count_range, median и балансировкой.
+        """
+        stack = []
+        node = self.root
+        last = None  # Последний пересчитанный узел
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right and top.right is not last:
+                node = top.right
+            else:
+                stack.pop()
+                self._update(top)
+                last = top
+
+    # Порядковые статистики: спуск по размерам поддеревьев, O(log n) в
+    # сбалансированном режиме. Размеры ведут insert, delete и from_sorted,
+    # для собранного вручную дерева сначала нужен recount()
+    def _count_below(self, value, inclusive):
+        """Число ключей < value (или <= value при inclusive)"""
+        count = 0
+        node = self.root
+        while node is not None:
+            if node.value < value or (inclusive and node.value == value):
+                count += self._size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
 
-    def _contains_recursive(self, node, value):
-        if node is None:
-            return False
+    def rank(self, value):
+        """Число ключей, меньших value"""
+        return self._count_below(value, inclusive=False)
+
+    def select(self, k):
+        """k-й по возрастанию ключ (нумерация с 0)"""
+        if k < 0 or k >= self.size():
+            raise IndexError("Index out of range")
+
+        node = self.root
+        while True:
+            left_size = self._size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
 
-        if node.value == value:
-            return True
-        elif value < node.value:
-            return self._contains_recursive(node.left, value)
-        else:
-            return self._contains_recursive(node.right, value)
+    def count_range(self, lo, hi):
+        """Число ключей x, для которых lo <= x <= hi"""
+        if hi < lo:
+            return 0
+        return self._count_below(hi, inclusive=True) - self._count_below(lo, inclusive=False)
+
+    def median(self):
+        """Медиана ключей: среднее двух средних при четном количестве"""
+        n = self.size()
+        if n == 0:
+            raise ValueError("Tree is empty")
+        if n % 2:
+            return self.select(n // 2)
+        return (self.select(n // 2 - 1) + self.select(n // 2)) / 2
 
     # Обходы дерева
     def inorder(self):
         """Центрированный обход (левый-корень-правый)"""
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
-
-    def _inorder_recursive(self, node, result):
-        if node:
-            self._inorder_recursive(node.left, result)
-            result.append(node.value)
-            self._inorder_recursive(node.right, result)
+        return list(self.iter_inorder())
+
+    def iter_inorder(self):
+        """Ленивый центрированный обход: значения по одному, без рекурсии"""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
 
     def preorder(self):
         """Прямой обход (корень-левый-правый)"""
-        result = []
-        self._preorder_recursive(self.root, result)
-        return result
-
-    def _preorder_recursive(self, node, result):
-        if node:
-            result.append(node.value)
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
+        return list(self.iter_preorder())
+
+    def iter_preorder(self):
+        """Ленивый прямой обход"""
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
 
     def postorder(self):
         """Обратный обход (левый-правый-корень)"""
-        result = []
-        self._postorder_recursive(self.root, result)
-        return result
-
-    def _postorder_recursive(self, node, result):
-        if node:
-            self._postorder_recursive(node.left, result)
-            self._postorder_recursive(node.right, result)
-            result.append(node.value)
+        return list(self.iter_postorder())
+
+    def iter_postorder(self):
+        """Ленивый обратный обход"""
+        stack = []
+        node = self.root
+        last = None  # Последний выданный узел
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right and top.right is not last:
+                node = top.right
+            else:
+                stack.pop()
+                yield top.value
+                last = top
 
     def level_order(self):
         """Обход по уровням (ширина)"""
-        if not self.root:
-            return []
+        return list(self.iter_level_order())
 
-        result = []
-        queue = deque([self.root])
+    def iter_level_order(self):
+        """Ленивый обход по уровням"""
+        queue = deque([self.root] if self.root else [])
 
         while queue:
             node = queue.popleft()
-            result.append(node.value)
+            yield node.value
 
             if node.left:
                 queue.append(node.left)
             if node.right:
                 queue.append(node.right)
 
-        return result
-
     def print_tree(self):
         """Визуальный вывод дерева"""
         if not self.root:
@@ -201,30 +406,25 @@ class BinaryTree:
 
     def max_depth(self):
         """Максимальная глубина дерева (задача 4)"""
-        return self._max_depth_recursive(self.root)
-
-    def _max_depth_recursive(self, node):
-        if node is None:
-            return 0
-        left_depth = self._max_depth_recursive(node.left)
-        right_depth = self._max_depth_recursive(node.right)
-        return max(left_depth, right_depth) + 1
+        depth = 0
+        level = [self.root] if self.root else []
+        while level:
+            depth += 1
+            level = [child for node in level for child in (node.left, node.right) if child]
+        return depth
 
     def count_full_nodes(self):
         """Количество узлов с обоими потомками (задача 5)"""
-        return self._count_full_nodes_recursive(self.root)
-
-    def _count_full_nodes_recursive(self, node):
-        if node is None:
-            return 0
-
         count = 0
-        if node.left and node.right:
-            count = 1
-
-        count += self._count_full_nodes_recursive(node.left)
-        count += self._count_full_nodes_recursive(node.right)
-
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            if node.left and node.right:
+                count += 1
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
         return count
 
     def is_symmetric(self):
@@ -234,14 +434,150 @@ class BinaryTree:
         return self._is_mirror(self.root.left, self.root.right)
 
     def _is_mirror(self, left, right):
-        if left is None and right is None:
-            return True
-        if left is None or right is None:
-            return False
-        if left.value != right.value:
-            return False
-        return (self._is_mirror(left.left, right.right) and
-                self._is_mirror(left.right, right.left))
+        """Зеркальность двух поддеревьев, пары узлов сравниваются через стек"""
+        stack = [(left, right)]
+        while stack:
+            left, right = stack.pop()
+            if left is None and right is None:
+                continue
+            if left is None or right is None:
+                return False
+            if left.value != right.value:
+                return False
+            stack.append((left.right, right.left))
+            stack.append((left.left, right.right))
+        return True
+
+
+class FrozenTree:
+    """Неизменяемое дерево поиска в массиве с раскладкой Эйтцингера
+
+    Ключи лежат в порядке обхода по уровням: у ячейки k потомки 2k и 2k+1,
+    ячейка 0 не используется. Узлов-объектов и указателей нет, верхние
+    уровни дерева находятся рядом в памяти, а спуск не требует ветвлений
+    по результату сравнения. Пакетные запросы по массивам NumPy
+    выполняются одним векторным спуском для всех ключей сразу.
+    """
+
+    def __init__(self, sorted_values):
+        values = list(sorted_values)
+        if any(b < a for a, b in zip(values, islice(values, 1, None))):
+            raise ValueError("Sequence must be sorted")
+
+        self._size = n = len(values)
+        self._keys = [None] * (n + 1)
+
+        # Центрированный обход неявного дерева раскладывает ключи по ячейкам
+        stack = []
+        k = 1
+        position = 0
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            self._keys[k] = values[position]
+            position += 1
+            k = 2 * k + 1
+
+        self._array = np.asarray(self._keys[1:]) if np is not None and n else None
+
+    def __len__(self):
+        return self._size
+
+    def _lower_bound(self, value):
+        """Ячейка наименьшего ключа >= value (0, если такого нет)"""
+        keys, n = self._keys, self._size
+        k = 1
+        while k <= n:
+            k = 2 * k + (keys[k] < value)
+        # Хвост из единиц - шаги вправо после последнего шага влево
+        return k // ((~k & (k + 1)) << 1)
+
+    def _upper_floor(self, value):
+        """Ячейка наибольшего ключа <= value (0, если такого нет)"""
+        keys, n = self._keys, self._size
+        k = 1
+        while k <= n:
+            k = 2 * k + (keys[k] <= value)
+        # Хвост из нулей - шаги влево после последнего шага вправо
+        return k // ((k & -k) << 1)
+
+    def contains(self, value):
+        """Проверка наличия ключа"""
+        k = self._lower_bound(value)
+        return k != 0 and self._keys[k] == value
+
+    def ceiling(self, value):
+        """Наименьший ключ >= value или None"""
+        return self._keys[self._lower_bound(value)]
+
+    def floor(self, value):
+        """Наибольший ключ <= value или None"""
+        return self._keys[self._upper_floor(value)]
+
+    def _descend(self, queries, right_if_equal):
+        """Векторный спуск: ячейки результата для всех ключей массива"""
+        n = self._size
+        k = np.ones(len(queries), dtype=np.intp)
+        for _ in range(n.bit_length()):
+            keys = self._array[np.minimum(k, n) - 1]
+            step = keys <= queries if right_if_equal else keys < queries
+            k = np.where(k <= n, 2 * k + step, k)
+
+        if right_if_equal:
+            return k // ((k & -k) << 1)
+        return k // ((~k & (k + 1)) << 1)
+
+    def _batch(self, queries, right_if_equal):
+        """Ячейки результата и маска найденных для пакета ключей"""
+        queries = np.asarray(queries)
+        if not self._size:
+            return np.zeros(queries.shape, dtype=np.intp), np.zeros(queries.shape, dtype=bool)
+
+        k = self._descend(queries.ravel(), right_if_equal).reshape(queries.shape)
+        return k, k != 0
+
+    def _result(self, k, found):
+        """Массив ключей по ячейкам, ненайденные значения скрыты маской"""
+        if not self._size:
+            return np.ma.masked_all(k.shape)
+        return np.ma.array(self._array[np.maximum(k, 1) - 1], mask=~found)
+
+    def contains_batch(self, queries):
+        """Наличие каждого ключа массива (массив bool)
+
+        Без NumPy принимает любую последовательность и возвращает список.
+        """
+        if np is None:
+            return [self.contains(value) for value in queries]
+
+        k, found = self._batch(queries, right_if_equal=False)
+        if not self._size:
+            return found
+        return found & (self._array[np.maximum(k, 1) - 1] == np.asarray(queries))
+
+    def ceiling_batch(self, queries):
+        """Наименьшие ключи >= каждого из запросов (маскированный массив)"""
+        if np is None:
+            return [self.ceiling(value) for value in queries]
+        return self._result(*self._batch(queries, right_if_equal=False))
+
+    def floor_batch(self, queries):
+        """Наибольшие ключи <= каждого из запросов (маскированный массив)"""
+        if np is None:
+            return [self.floor(value) for value in queries]
+        return self._result(*self._batch(queries, right_if_equal=True))
+
+
+def merge(a, b):
+    """Новое сбалансированное дерево из значений двух деревьев за O(n + m)
+
+    Центрированные обходы обоих деревьев уже отсортированы, поэтому они
+    сливаются одним проходом и дерево строится через from_sorted.
+    """
+    return BinaryTree.from_sorted(heapq.merge(a.iter_inorder(), b.iter_inorder()),
+                                  balanced=a.balanced or b.balanced)
 
 
 # Задача 1: Дерево со случайными числами
@@ -445,6 +781,219 @@ def task6():
     print(f"\nДерево симметрично: {asym_tree.is_symmetric()}")
 
 
+# Задача 7: Сбалансированное дерево
+def task7():
+    print("\n" + "=" * 60)
+    print("ЗАДАНИЕ 7: Сбалансированное (АВЛ) дерево")
+    print("=" * 60)
+
+    values = list(range(1, 16))
+    plain = BinaryTree()
+    balanced = BinaryTree(balanced=True)
+    for val in values:
+        plain.insert(val)
+        balanced.insert(val)
+
+    print(f"Добавляем отсортированные числа: {values}")
+    print(f"Глубина обычного дерева: {plain.max_depth()}")
+    print(f"Глубина сбалансированного дерева: {balanced.max_depth()}")
+    balanced.print_tree()
+
+    for val in (8, 1, 2, 3):
+        balanced.delete(val)
+    print(f"\nПосле удаления 8, 1, 2, 3: {balanced.inorder()}")
+    print(f"Глубина: {balanced.max_depth()}")
+    balanced.print_tree()
+
+
+# Задача 8: Глубокое дерево без рекурсии
+def task8():
+    print("\n" + "=" * 60)
+    print("ЗАДАНИЕ 8: Вырожденное дерево глубже предела рекурсии")
+    print("=" * 60)
+
+    tree = BinaryTree()
+    for val in range(3000):
+        tree.insert(val)
+
+    print(f"Глубина: {tree.max_depth()}")
+    print(f"Содержит 2999: {tree.contains(2999)}")
+    tree.delete(1500)
+    print(f"После удаления 1500 содержит его: {tree.contains(1500)}")
+    print(f"Первые 5 значений inorder: {list(islice(tree.iter_inorder(), 5))}")
+    print(f"Первые 5 значений postorder: {list(islice(tree.iter_postorder(), 5))}")
+
+
+# Задача 9: Построение из отсортированных данных и слияние
+def task9():
+    print("\n" + "=" * 60)
+    print("ЗАДАНИЕ 9: Построение дерева за O(n) и слияние деревьев")
+    print("=" * 60)
+
+    tree = BinaryTree.from_sorted(range(10, 160, 10))
+    print(f"Дерево из {tree.inorder()}, глубина {tree.max_depth()}:")
+    tree.print_tree()
+
+    other = BinaryTree()
+    for val in [55, 5, 95, 175]:
+        other.insert(val)
+    merged = merge(tree, other)
+    print(f"\nСлияние с деревом {other.inorder()}: {merged.inorder()}")
+    print(f"Глубина результата: {merged.max_depth()}")
+
+
+# Задача 10: Замороженное дерево в массиве
+def task10():
+    print("\n" + "=" * 60)
+    print("ЗАДАНИЕ 10: Замороженное дерево (раскладка Эйтцингера)")
+    print("=" * 60)
+
+    tree = BinaryTree()
+    for val in [50, 30, 70, 20, 40, 60, 80]:
+        tree.insert(val)
+    frozen = tree.freeze()
+
+    print(f"Ключи по ячейкам массива: {frozen._keys[1:]}")
+    print(f"Содержит 40: {frozen.contains(40)}, содержит 45: {frozen.contains(45)}")
+    print(f"floor(45) = {frozen.floor(45)}, ceiling(45) = {frozen.ceiling(45)}")
+    print(f"floor(10) = {frozen.floor(10)}, ceiling(90) = {frozen.ceiling(90)}")
+
+    queries = [10, 20, 45, 80, 90]
+    print(f"\nПакетный запрос {queries}:")
+    if np is not None:
+        queries = np.array(queries)
+    print(f"contains: {frozen.contains_batch(queries)}")
+    print(f"floor:    {frozen.floor_batch(queries)}")
+    print(f"ceiling:  {frozen.ceiling_batch(queries)}")
+
+
+# Задача 11: Порядковые статистики
+def task11():
+    print("\n" + "=" * 60)
+    print("ЗАДАНИЕ 11: Ранг, k-й элемент и количество ключей в диапазоне")
+    print("=" * 60)
+
+    tree = BinaryTree(balanced=True)
+    values = random.sample(range(1, 101), 11)
+    for val in values:
+        tree.insert(val)
+
+    print(f"Ключи: {tree.inorder()}")
+    print(f"Медиана: {tree.median()}")
+    print(f"Ранг 50 (ключей меньше 50): {tree.rank(50)}")
+    print(f"3-й по возрастанию ключ (с нуля): {tree.select(3)}")
+    print(f"Ключей в диапазоне [25, 75]: {tree.count_range(25, 75)}")
+
+    tree.delete(tree.select(0))
+    print(f"\nПосле удаления минимума: {tree.inorder()}")
+    print(f"Медиана: {tree.median()}")
+
+
+def benchmark_order_statistics(size=10 ** 6, queries=10 ** 4):
+    """Порядковые статистики по размерам поддеревьев против обхода inorder"""
+    print("\n" + "=" * 60)
+    print(f"ПОРЯДКОВЫЕ СТАТИСТИКИ В ДЕРЕВЕ ИЗ {size} КЛЮЧЕЙ")
+    print("=" * 60)
+
+    tree = BinaryTree.from_sorted(range(size), balanced=True)
+    rng = random.Random(42)
+    ranges = [sorted(rng.sample(range(size), 2)) for _ in range(queries)]
+
+    start = time.perf_counter()
+    counts = [tree.count_range(lo, hi) for lo, hi in ranges]
+    print(f"{queries} запросов count_range: {time.perf_counter() - start:7.3f} с")
+    assert counts == [hi - lo + 1 for lo, hi in ranges]
+
+    start = time.perf_counter()
+    median = tree.median()
+    print(f"{'median':>24}: {(time.perf_counter() - start) * 1e6:7.1f} мкс")
+
+    start = time.perf_counter()
+    keys = tree.inorder()
+    print(f"{'один обход inorder':>24}: {time.perf_counter() - start:7.3f} с")
+    assert median == (keys[(size - 1) // 2] + keys[size // 2]) / 2
+
+
+def benchmark_frozen(size=10 ** 6, queries=10 ** 5):
+    """Поиск в дереве узлов против замороженного дерева и пакетных запросов"""
+    print("\n" + "=" * 60)
+    print(f"ПОИСК {queries} КЛЮЧЕЙ В ДЕРЕВЕ ИЗ {size} (NumPy: {'есть' if np else 'нет'})")
+    print("=" * 60)
+
+    tree = BinaryTree.from_sorted(range(0, 2 * size, 2))
+    frozen = tree.freeze()
+    rng = random.Random(42)
+    keys = [rng.randrange(2 * size) for _ in range(queries)]
+
+    start = time.perf_counter()
+    expected = [tree.contains(key) for key in keys]
+    print(f"{'BinaryTree.contains':>24}: {time.perf_counter() - start:7.3f} с")
+
+    start = time.perf_counter()
+    found = [frozen.contains(key) for key in keys]
+    print(f"{'FrozenTree.contains':>24}: {time.perf_counter() - start:7.3f} с")
+    assert found == expected
+
+    if np is not None:
+        batch = np.array(keys)
+        start = time.perf_counter()
+        found = frozen.contains_batch(batch)
+        print(f"{'FrozenTree.contains_batch':>24}: {time.perf_counter() - start:7.3f} с")
+        assert found.tolist() == expected
+
+
+def benchmark_bulk_load(size=10 ** 6, insert_size=10 ** 5):
+    """Построение через from_sorted против поэлементной вставки, слияние"""
+    print("\n" + "=" * 60)
+    print(f"ПОСТРОЕНИЕ ДЕРЕВА ИЗ {size} ОТСОРТИРОВАННЫХ КЛЮЧЕЙ")
+    print("=" * 60)
+
+    for count in (insert_size, size):
+        start = time.perf_counter()
+        tree = BinaryTree.from_sorted(range(count), balanced=True)
+        print(f"from_sorted, n={count:<8}: {time.perf_counter() - start:7.3f} с, "
+              f"глубина {tree.max_depth()}")
+
+    start = time.perf_counter()
+    tree = BinaryTree(balanced=True)
+    for key in range(insert_size):
+        tree.insert(key)
+    print(f"insert АВЛ,  n={insert_size:<8}: {time.perf_counter() - start:7.3f} с, "
+          f"глубина {tree.max_depth()}")
+
+    evens = BinaryTree.from_sorted(range(0, size, 2))
+    odds = BinaryTree.from_sorted(range(1, size, 2))
+    start = time.perf_counter()
+    merged = merge(evens, odds)
+    print(f"merge двух деревьев по {size // 2}: {time.perf_counter() - start:7.3f} с, "
+          f"глубина {merged.max_depth()}")
+
+
+def benchmark_balanced(size=10 ** 6, plain_size=5000):
+    """Вставка отсортированных ключей: обычное дерево против АВЛ"""
+    print("\n" + "=" * 60)
+    print(f"ВСТАВКА {size} ОТСОРТИРОВАННЫХ КЛЮЧЕЙ")
+    print("=" * 60)
+
+    # Обычное дерево на отсортированных данных вырождается в цепочку
+    # и вставка стоит O(n^2), поэтому для него размер меньше
+    for label, tree, count in (("обычное", BinaryTree(), plain_size),
+                               ("АВЛ", BinaryTree(balanced=True), plain_size),
+                               ("АВЛ", BinaryTree(balanced=True), size)):
+        start = time.perf_counter()
+        for key in range(count):
+            tree.insert(key)
+        insert_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in range(0, count, max(1, count // 1000)):
+            tree.contains(key)
+        search_time = time.perf_counter() - start
+
+        print(f"{label:>8}, n={count:<8}: вставка {insert_time:8.3f} с, "
+              f"глубина {tree.max_depth():4}, 1000 поисков {search_time * 1000:7.2f} мс")
+
+
 def main():
     """Главная функция запуска всех заданий"""
     print("ЛАБОРАТОРНАЯ РАБОТА ПО БИНАРНЫМ ДЕРЕВЬЯМ")
@@ -457,6 +1006,11 @@ def main():
     task4()
     task5()
     task6()
+    task7()
+    task8()
+    task9()
+    task10()
+    task11()
 
     print("\n" + "=" * 60)
     print("ВСЕ ЗАДАНИЯ ВЫПОЛНЕНЫ!")
@@ -464,4 +1018,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
+    benchmark_balanced()
+    benchmark_bulk_load()
+    benchmark_frozen()
+    benchmark_order_statistics()
\ No newline at end of file